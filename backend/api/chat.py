@@ -3,22 +3,31 @@ Chat API endpoints for the journal assistant.
 """
 
 from datetime import date
-from typing import List, Tuple
+from typing import Iterator, List, Literal, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+import orjson
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
-from backend.services.llm_client import chat_with_journal_context
+from backend.services.llm_client import (
+    chat_with_journal_context,
+    stream_chat_with_journal_context,
+)
 
 router = APIRouter(prefix="/api/chat", tags=["chat"])
 
 
 class ChatMessage(BaseModel):
-    role: str = Field(..., pattern="^(user|assistant)$")
+    model_config = ConfigDict(frozen=True)
+
+    role: Literal["user", "assistant"]
     content: str
 
 
 class ChatRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     message: str = Field(..., min_length=1)
     start_date: date
     end_date: date
@@ -26,39 +35,52 @@ class ChatRequest(BaseModel):
 
 
 class ChatResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     response: str
     start_date: date
     end_date: date
 
 
-@router.post("/", response_model=ChatResponse)
-async def chat(request: ChatRequest) -> ChatResponse:
-    """
-    Send a message to the journal assistant with context from the specified date range.
-    """
+# Prebuilt serializer so the handler can emit JSON directly
+_CHAT_RESPONSE_ADAPTER = TypeAdapter(ChatResponse)
+
+
+def _validate_window(request: ChatRequest) -> None:
     if request.start_date > request.end_date:
         raise HTTPException(
             status_code=400,
             detail="Start date must be on or before end date"
         )
 
-    # Convert history to the format expected by the LLM client
-    history_tuples: List[Tuple[str, str]] = []
-    for i in range(0, len(request.history) - 1, 2):
-        if (request.history[i].role == "user" and 
-            i + 1 < len(request.history) and 
-            request.history[i + 1].role == "assistant"):
-            history_tuples.append((
-                request.history[i].content,
-                request.history[i + 1].content
-            ))
+
+def _history_tuples(request: ChatRequest) -> Optional[List[Tuple[str, str]]]:
+    """
+    Convert history to the format expected by the LLM client:
+    consecutive (user, assistant) message pairs.
+    """
+    msgs = request.history
+    pairs: List[Tuple[str, str]] = [
+        (user_msg.content, assistant_msg.content)
+        for user_msg, assistant_msg in zip(msgs[0::2], msgs[1::2])
+        if user_msg.role == "user" and assistant_msg.role == "assistant"
+    ]
+    return pairs or None
+
+
+@router.post("/", response_model=ChatResponse)
+async def chat(request: ChatRequest) -> Response:
+    """
+    Send a message to the journal assistant with context from the specified date range.
+    """
+    _validate_window(request)
 
     try:
         response = chat_with_journal_context(
             message=request.message,
             start_date=request.start_date,
             end_date=request.end_date,
-            history=history_tuples if history_tuples else None,
+            history=_history_tuples(request),
         )
     except Exception as e:
         raise HTTPException(
@@ -66,9 +88,56 @@ async def chat(request: ChatRequest) -> ChatResponse:
             detail=f"Failed to get response from assistant: {str(e)}"
         )
 
-    return ChatResponse(
+    # Built from the validated request and the model's reply; no need to re-validate
+    chat_response = ChatResponse.model_construct(
         response=response,
         start_date=request.start_date,
         end_date=request.end_date,
     )
+    return Response(
+        content=_CHAT_RESPONSE_ADAPTER.dump_json(chat_response),
+        media_type="application/json",
+    )
+
 
+def _sse(data: dict, event: Optional[str] = None) -> str:
+    """Format a Server-Sent Events message."""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {orjson.dumps(data).decode()}\n\n"
+
+
+@router.post("/stream")
+async def chat_stream(request: ChatRequest) -> StreamingResponse:
+    """
+    Streaming variant of the chat endpoint using Server-Sent Events.
+
+    Emits ``data: {"chunk": ...}`` messages as the assistant generates text,
+    followed by a final ``done`` event (or an ``error`` event on failure).
+    """
+    _validate_window(request)
+    history = _history_tuples(request)
+
+    # A sync generator: Starlette iterates it in a worker thread, so the
+    # blocking Ollama stream never stalls the event loop
+    def event_stream() -> Iterator[str]:
+        try:
+            for chunk in stream_chat_with_journal_context(
+                message=request.message,
+                start_date=request.start_date,
+                end_date=request.end_date,
+                history=history,
+            ):
+                yield _sse({"chunk": chunk})
+        except Exception as e:
+            yield _sse(
+                {"detail": f"Failed to get response from assistant: {str(e)}"},
+                event="error",
+            )
+            return
+        yield _sse({}, event="done")
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
@@ -2,13 +2,19 @@
 REST API endpoints for fetching WHOOP health data.
 """
 
+import asyncio
+import hashlib
+from collections import Counter
 from datetime import date
-from typing import List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
 
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+import httpx
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 from backend.api.whoop_oauth import get_access_token
+from backend.core.cache import TTLCache
 from backend.services.whoop_client import (
     WhoopClient,
     UserProfile,
@@ -21,16 +27,106 @@ from backend.services.whoop_client import (
 
 router = APIRouter(prefix="/api/whoop/data", tags=["whoop-data"])
 
+T = TypeVar("T")
 
-def _get_client() -> WhoopClient:
-    """Get an authenticated WHOOP client."""
-    token = get_access_token()
+# Response cache lifetimes (seconds), tiered by how often the data changes
+SHORT_TTL = 10      # debug probes
+NORMAL_TTL = 30     # cycles, sleep, recovery, workouts, summary
+LONG_TTL = 3600     # profile and body measurements
+
+_response_cache = TTLCache(maxsize=256)
+
+# One client per access token, so its connection pool survives across requests
+_clients: Dict[str, WhoopClient] = {}
+
+# Requests currently using each client, and clients replaced after a token
+# change that are closed once no request is using them
+_in_use: Counter = Counter()
+_retired: List[WhoopClient] = []
+
+
+def _get_client(token: Optional[str]) -> WhoopClient:
+    """
+    Get an authenticated WHOOP client for ``token``.
+
+    Callers read the token with ``await run_in_threadpool(get_access_token)``,
+    since the token store is a blocking database query.
+    """
     if not token:
         raise HTTPException(
             status_code=401,
             detail="Not authenticated with WHOOP. Please login at /api/whoop/login"
         )
-    return WhoopClient(token)
+
+    client = _clients.get(token)
+    if client is None:
+        # The token was refreshed or replaced; retire clients for stale tokens.
+        # They are not closed here because requests already running (e.g. a
+        # long /summary) may still be using them; _cached closes each one
+        # once its in-flight count drops to zero.
+        _retired.extend(_clients.values())
+        _clients.clear()
+        client = _clients[token] = WhoopClient(token)
+    return client
+
+
+async def _cached(
+    client: WhoopClient,
+    key: tuple,
+    ttl: float,
+    fetch: Callable[[], Awaitable[T]],
+) -> T:
+    """
+    Return the cached result for ``key`` or await ``fetch`` and cache it.
+
+    Keys are scoped to a hash of the access token so one user's data is never
+    served to another. If WHOOP answers with a 5xx, the last cached value is
+    returned even if it has expired.
+    """
+    token_hash = hashlib.sha256(client.access_token.encode("utf-8")).hexdigest()
+    cache_key = (token_hash, *key)
+
+    # Counted before the first await, so the client cannot be retired and
+    # closed between _get_client handing it out and the fetch starting
+    _in_use[client] += 1
+    try:
+        cached: Any = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            result = await fetch()
+        except httpx.HTTPStatusError as e:
+            stale = _response_cache.get_stale(cache_key)
+            if e.response.status_code >= 500 and stale is not None:
+                return stale
+            raise
+
+        _response_cache.set(cache_key, result, ttl)
+        return result
+    finally:
+        _in_use[client] -= 1
+        if not _in_use[client]:
+            del _in_use[client]
+        await _close_idle_retired()
+
+
+async def _close_idle_retired() -> None:
+    """Close retired clients that no request is using any more."""
+    idle = [client for client in _retired if client not in _in_use]
+    # Drop them from _retired before awaiting so a concurrent sweep skips them
+    _retired[:] = [client for client in _retired if client in _in_use]
+    for client in idle:
+        await client.aclose()
+
+
+async def close_clients() -> None:
+    """Close and forget all cached and retired WHOOP clients."""
+    while _clients:
+        _, client = _clients.popitem()
+        await client.aclose()
+    while _retired:
+        await _retired.pop().aclose()
 
 
 # =============================================================================
@@ -38,12 +134,16 @@ def _get_client() -> WhoopClient:
 # =============================================================================
 
 class ProfileResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     profile: UserProfile
     body: Optional[BodyMeasurement] = None
 
 
 class HealthSummary(BaseModel):
     """Combined health summary for a date range."""
+    model_config = ConfigDict(frozen=True)
+
     start_date: date
     end_date: date
     cycles: List[Cycle]
@@ -52,6 +152,21 @@ class HealthSummary(BaseModel):
     workouts: List[Workout]
 
 
+# Prebuilt serializers so handlers can emit JSON directly, skipping FastAPI's
+# per-request response-model validation and jsonable_encoder pass
+_PROFILE_ADAPTER = TypeAdapter(ProfileResponse)
+_CYCLES_ADAPTER = TypeAdapter(List[Cycle])
+_SLEEP_ADAPTER = TypeAdapter(List[Sleep])
+_RECOVERY_ADAPTER = TypeAdapter(List[Recovery])
+_WORKOUTS_ADAPTER = TypeAdapter(List[Workout])
+_SUMMARY_ADAPTER = TypeAdapter(HealthSummary)
+
+
+def _json_response(adapter: TypeAdapter, value: Any) -> Response:
+    """Serialize ``value`` with a prebuilt adapter into a JSON response."""
+    return Response(content=adapter.dump_json(value), media_type="application/json")
+
+
 # =============================================================================
 # User Endpoints
 # =============================================================================
@@ -61,8 +176,8 @@ async def debug_endpoints():
     """
     Debug endpoint to test which WHOOP API paths work.
     """
-    client = _get_client()
-    return await client.debug_endpoints()
+    client = _get_client(await run_in_threadpool(get_access_token))
+    return await _cached(client, ("debug",), SHORT_TTL, client.debug_endpoints)
 
 
 @router.get("/profile", response_model=ProfileResponse)
@@ -73,21 +188,31 @@ async def get_profile():
     Note: Body measurements require the 'read:body_measurement' scope.
     If not authorized, only profile data will be returned.
     """
-    client = _get_client()
+    client = _get_client(await run_in_threadpool(get_access_token))
+    
+    async def fetch() -> ProfileResponse:
+        # The two endpoints are independent, so request them concurrently
+        profile, body = await asyncio.gather(
+            client.get_profile(),
+            client.get_body_measurement(),
+            return_exceptions=True,
+        )
+        if isinstance(profile, Exception):
+            raise profile
+        
+        # Body measurement is optional (requires separate scope)
+        if isinstance(body, Exception):
+            body = None  # Scope not granted or other error - continue without body data
+        
+        # Both parts are already validated models
+        return ProfileResponse.model_construct(profile=profile, body=body)
     
     try:
-        profile = await client.get_profile()
+        profile = await _cached(client, ("profile",), LONG_TTL, fetch)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
-    # Body measurement is optional (requires separate scope)
-    body = None
-    try:
-        body = await client.get_body_measurement()
-    except Exception:
-        pass  # Scope not granted or other error - continue without body data
-    
-    return ProfileResponse(profile=profile, body=body)
+    return _json_response(_PROFILE_ADAPTER, profile)
 
 
 # =============================================================================
@@ -98,7 +223,9 @@ async def get_profile():
 async def get_cycles(
     start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
-    limit: int = Query(25, ge=1, le=100, description="Max records to return"),
+    limit: int = Query(
+        WhoopClient.MAX_PAGE, ge=1, le=WhoopClient.MAX_PAGE, description="Max records to return"
+    ),
 ):
     """
     Get physiological cycles for a date range.
@@ -106,18 +233,23 @@ async def get_cycles(
     Cycles represent the body's biological rhythm (wake-sleep-wake).
     Each cycle includes strain, kilojoules, and heart rate data.
     """
-    client = _get_client()
+    client = _get_client(await run_in_threadpool(get_access_token))
     
     try:
-        cycles, _ = await client.get_cycles(
-            start_date=start_date,
-            end_date=end_date,
-            limit=limit,
+        cycles, _ = await _cached(
+            client,
+            ("cycles", start_date, end_date, limit),
+            NORMAL_TTL,
+            lambda: client.get_cycles(
+                start_date=start_date,
+                end_date=end_date,
+                limit=limit,
+            ),
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
-    return cycles
+    return _json_response(_CYCLES_ADAPTER, cycles)
 
 
 # =============================================================================
@@ -128,25 +260,32 @@ async def get_cycles(
 async def get_sleep(
     start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
-    limit: int = Query(25, ge=1, le=100, description="Max records to return"),
+    limit: int = Query(
+        WhoopClient.MAX_PAGE, ge=1, le=WhoopClient.MAX_PAGE, description="Max records to return"
+    ),
 ):
     """
     Get sleep records for a date range.
     
     Includes sleep stages (light, deep, REM), efficiency, and performance.
     """
-    client = _get_client()
+    client = _get_client(await run_in_threadpool(get_access_token))
     
     try:
-        sleep_records, _ = await client.get_sleep(
-            start_date=start_date,
-            end_date=end_date,
-            limit=limit,
+        sleep_records, _ = await _cached(
+            client,
+            ("sleep", start_date, end_date, limit),
+            NORMAL_TTL,
+            lambda: client.get_sleep(
+                start_date=start_date,
+                end_date=end_date,
+                limit=limit,
+            ),
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
-    return sleep_records
+    return _json_response(_SLEEP_ADAPTER, sleep_records)
 
 
 # =============================================================================
@@ -157,7 +296,9 @@ async def get_sleep(
 async def get_recovery(
     start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
-    limit: int = Query(25, ge=1, le=100, description="Max records to return"),
+    limit: int = Query(
+        WhoopClient.MAX_PAGE, ge=1, le=WhoopClient.MAX_PAGE, description="Max records to return"
+    ),
 ):
     """
     Get recovery scores for a date range.
@@ -165,18 +306,23 @@ async def get_recovery(
     Recovery is a daily measure (0-100%) of how prepared your body is to perform.
     Includes HRV, resting heart rate, SpO2, and skin temperature.
     """
-    client = _get_client()
+    client = _get_client(await run_in_threadpool(get_access_token))
     
     try:
-        recovery_records, _ = await client.get_recovery(
-            start_date=start_date,
-            end_date=end_date,
-            limit=limit,
+        recovery_records, _ = await _cached(
+            client,
+            ("recovery", start_date, end_date, limit),
+            NORMAL_TTL,
+            lambda: client.get_recovery(
+                start_date=start_date,
+                end_date=end_date,
+                limit=limit,
+            ),
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
-    return recovery_records
+    return _json_response(_RECOVERY_ADAPTER, recovery_records)
 
 
 # =============================================================================
@@ -187,25 +333,32 @@ async def get_recovery(
 async def get_workouts(
     start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
-    limit: int = Query(25, ge=1, le=100, description="Max records to return"),
+    limit: int = Query(
+        WhoopClient.MAX_PAGE, ge=1, le=WhoopClient.MAX_PAGE, description="Max records to return"
+    ),
 ):
     """
     Get workout activities for a date range.
     
     Includes sport type, strain score, heart rate, and distance.
     """
-    client = _get_client()
+    client = _get_client(await run_in_threadpool(get_access_token))
     
     try:
-        workouts, _ = await client.get_workouts(
-            start_date=start_date,
-            end_date=end_date,
-            limit=limit,
+        workouts, _ = await _cached(
+            client,
+            ("workouts", start_date, end_date, limit),
+            NORMAL_TTL,
+            lambda: client.get_workouts(
+                start_date=start_date,
+                end_date=end_date,
+                limit=limit,
+            ),
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
-    return workouts
+    return _json_response(_WORKOUTS_ADAPTER, workouts)
 
 
 # =============================================================================
@@ -228,21 +381,26 @@ async def get_health_summary(
             detail="start_date must be before or equal to end_date"
         )
     
-    client = _get_client()
+    client = _get_client(await run_in_threadpool(get_access_token))
     
     try:
-        cycles = await client.get_all_cycles(start_date=start_date, end_date=end_date)
-        sleep = await client.get_all_sleep(start_date=start_date, end_date=end_date)
-        recovery = await client.get_all_recovery(start_date=start_date, end_date=end_date)
-        workouts = await client.get_all_workouts(start_date=start_date, end_date=end_date)
+        # get_all fetches the four data types concurrently
+        sync = await _cached(
+            client,
+            ("summary", start_date, end_date),
+            NORMAL_TTL,
+            lambda: client.get_all(start_date=start_date, end_date=end_date),
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
-    return HealthSummary(
+    # Records are already validated WHOOP models, so skip re-validating them
+    summary = HealthSummary.model_construct(
         start_date=start_date,
         end_date=end_date,
-        cycles=cycles,
-        sleep=sleep,
-        recovery=recovery,
-        workouts=workouts,
+        cycles=sync.cycles,
+        sleep=sync.sleep,
+        recovery=sync.recovery,
+        workouts=sync.workouts,
     )
+    return _json_response(_SUMMARY_ADAPTER, summary)
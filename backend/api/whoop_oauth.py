@@ -2,13 +2,16 @@
 WHOOP OAuth 2.0 endpoints for authorization and token management.
 """
 
-import secrets
+from base64 import urlsafe_b64encode
+from os import urandom
 from typing import Optional
+from urllib.parse import quote, urlencode
 
-import httpx
-from fastapi import APIRouter, HTTPException, Query
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import RedirectResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from backend.core.config import (
     WHOOP_CLIENT_ID,
@@ -18,14 +21,31 @@ from backend.core.config import (
     WHOOP_TOKEN_URL,
     WHOOP_SCOPES,
 )
+from backend.data_access.token_store import (
+    clear_tokens,
+    get_token_field,
+    get_tokens,
+    set_token_fields,
+)
 
 router = APIRouter(prefix="/api/whoop", tags=["whoop"])
 
-# In-memory token storage (replace with database storage in production)
-_token_storage: dict = {}
+# Authorization URL with every parameter except the per-request state, which
+# is appended in whoop_login. Values are percent-encoded (scopes contain spaces).
+_AUTH_URL_PREFIX = f"{WHOOP_AUTH_URL}?" + urlencode(
+    {
+        "client_id": WHOOP_CLIENT_ID,
+        "redirect_uri": WHOOP_REDIRECT_URI,
+        "response_type": "code",
+        "scope": WHOOP_SCOPES,
+    },
+    quote_via=quote,
+)
 
 
 class TokenInfo(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     access_token: str
     refresh_token: Optional[str] = None
     expires_in: int
@@ -34,17 +54,24 @@ class TokenInfo(BaseModel):
 
 
 class TokenStatus(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     authenticated: bool
     scopes: Optional[str] = None
 
 
 def _generate_state() -> str:
     """Generate a random 8-character state string for CSRF protection."""
-    return secrets.token_urlsafe(6)[:8]
+    # 6 random bytes encode to exactly 8 URL-safe base64 characters (no padding)
+    return urlsafe_b64encode(urandom(6)).decode("ascii")
+
 
+# Token store calls are blocking database queries: handlers that only touch
+# the store are plain defs (run in the threadpool), and async handlers push
+# each call through run_in_threadpool
 
 @router.get("/login")
-async def whoop_login():
+def whoop_login():
     """
     Initiates the WHOOP OAuth flow by redirecting the user to WHOOP's authorization page.
     """
@@ -55,25 +82,17 @@ async def whoop_login():
         )
 
     state = _generate_state()
-    _token_storage["oauth_state"] = state
+    set_token_fields(oauth_state=state)
 
-    # Build authorization URL with required parameters
-    auth_params = {
-        "client_id": WHOOP_CLIENT_ID,
-        "redirect_uri": WHOOP_REDIRECT_URI,
-        "response_type": "code",
-        "scope": WHOOP_SCOPES,
-        "state": state,
-    }
-
-    query_string = "&".join(f"{k}={v}" for k, v in auth_params.items())
-    authorization_url = f"{WHOOP_AUTH_URL}?{query_string}"
+    # State is URL-safe base64, so it needs no further encoding
+    authorization_url = f"{_AUTH_URL_PREFIX}&state={state}"
 
     return RedirectResponse(url=authorization_url)
 
 
 @router.get("/callback")
 async def whoop_callback(
+    request: Request,
     code: str = Query(..., description="Authorization code from WHOOP"),
     state: str = Query(..., description="State parameter for CSRF validation"),
 ):
@@ -82,7 +101,7 @@ async def whoop_callback(
     Exchanges the authorization code for access and refresh tokens.
     """
     # Validate state to prevent CSRF attacks
-    stored_state = _token_storage.get("oauth_state")
+    stored_state = await run_in_threadpool(get_token_field, "oauth_state")
     if not stored_state or state != stored_state:
         raise HTTPException(
             status_code=400,
@@ -90,7 +109,7 @@ async def whoop_callback(
         )
 
     # Clear the used state
-    _token_storage.pop("oauth_state", None)
+    await run_in_threadpool(set_token_fields, oauth_state=None)
 
     # Exchange authorization code for tokens
     token_data = {
@@ -101,37 +120,39 @@ async def whoop_callback(
         "client_secret": WHOOP_CLIENT_SECRET,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            WHOOP_TOKEN_URL,
-            data=token_data,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
+    response = await request.app.state.httpx.post(
+        WHOOP_TOKEN_URL,
+        data=token_data,
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
 
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=f"Failed to exchange code for token: {response.text}"
-            )
+    if response.status_code != 200:
+        raise HTTPException(
+            status_code=response.status_code,
+            detail=f"Failed to exchange code for token: {response.text}"
+        )
 
-        tokens = response.json()
+    tokens = orjson.loads(response.content)
 
-    # Store tokens (in production, save to database with user association)
-    _token_storage["access_token"] = tokens.get("access_token")
-    _token_storage["refresh_token"] = tokens.get("refresh_token")
-    _token_storage["expires_in"] = tokens.get("expires_in")
-    _token_storage["scope"] = tokens.get("scope")
+    # Store tokens in the database so every worker shares the login
+    await run_in_threadpool(
+        set_token_fields,
+        access_token=tokens.get("access_token"),
+        refresh_token=tokens.get("refresh_token"),
+        expires_in=tokens.get("expires_in"),
+        scope=tokens.get("scope"),
+    )
 
     # Redirect to frontend with success message
     return RedirectResponse(url="/?whoop_connected=true")
 
 
 @router.post("/refresh")
-async def refresh_token():
+async def refresh_token(request: Request):
     """
     Refreshes the WHOOP access token using the stored refresh token.
     """
-    refresh_token = _token_storage.get("refresh_token")
+    refresh_token = await run_in_threadpool(get_token_field, "refresh_token")
     if not refresh_token:
         raise HTTPException(
             status_code=401,
@@ -146,48 +167,51 @@ async def refresh_token():
         "scope": "offline",
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            WHOOP_TOKEN_URL,
-            data=token_data,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
+    response = await request.app.state.httpx.post(
+        WHOOP_TOKEN_URL,
+        data=token_data,
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
 
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=f"Failed to refresh token: {response.text}"
-            )
+    if response.status_code != 200:
+        raise HTTPException(
+            status_code=response.status_code,
+            detail=f"Failed to refresh token: {response.text}"
+        )
 
-        tokens = response.json()
+    tokens = orjson.loads(response.content)
 
     # Update stored tokens
-    _token_storage["access_token"] = tokens.get("access_token")
-    _token_storage["refresh_token"] = tokens.get("refresh_token")
-    _token_storage["expires_in"] = tokens.get("expires_in")
-    _token_storage["scope"] = tokens.get("scope")
+    await run_in_threadpool(
+        set_token_fields,
+        access_token=tokens.get("access_token"),
+        refresh_token=tokens.get("refresh_token"),
+        expires_in=tokens.get("expires_in"),
+        scope=tokens.get("scope"),
+    )
 
     return {"message": "Token refreshed successfully", "expires_in": tokens.get("expires_in")}
 
 
 @router.get("/status", response_model=TokenStatus)
-async def token_status():
+def token_status():
     """
     Returns the current authentication status.
     """
-    access_token = _token_storage.get("access_token")
+    tokens = get_tokens()
+    access_token = tokens["access_token"]
     return TokenStatus(
         authenticated=bool(access_token),
-        scopes=_token_storage.get("scope") if access_token else None,
+        scopes=tokens["scope"] if access_token else None,
     )
 
 
 @router.post("/logout")
-async def logout():
+def logout():
     """
     Clears the stored tokens (local logout).
     """
-    _token_storage.clear()
+    clear_tokens()
     return {"message": "Logged out successfully"}
 
 
@@ -195,4 +219,4 @@ def get_access_token() -> Optional[str]:
     """
     Helper function to get the current access token for use in other modules.
     """
-    return _token_storage.get("access_token")
+    return get_token_field("access_token")
@@ -0,0 +1,62 @@
+"""
+Small in-process TTL cache shared by the API and service layers.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Bounded LRU mapping whose entries expire after a per-entry time-to-live.
+
+    Expired entries are kept until evicted so callers can fall back to a stale
+    value when the upstream source is unavailable. Safe to share across threads.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for ``key`` if present and not expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[0] < time.monotonic():
+                return default
+            self._data.move_to_end(key)
+            return item[1]
+
+    def get_stale(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for ``key`` even if it has expired."""
+        with self._lock:
+            item = self._data.get(key)
+        return default if item is None else item[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float]) -> None:
+        """Store ``value`` for ``ttl`` seconds (``None`` never expires)."""
+        expires_at = float("inf") if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.pop(key, None)
+        return default if item is None else item[1]
+
+    def keys(self) -> List[Hashable]:
+        with self._lock:
+            return list(self._data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
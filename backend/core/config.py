@@ -11,10 +11,24 @@ load_dotenv()
 
 # Ollama model configuration (runs locally, no API key needed)
 OLLAMA_MODEL = os.environ.get("OLLAMA_MODEL", "llama3.2")
+# Ollama server URL; unset falls back to the client's default (localhost:11434)
+OLLAMA_HOST = os.environ.get("OLLAMA_HOST") or None
+# Per-request timeout in seconds; unset waits indefinitely for slow generations
+OLLAMA_TIMEOUT = float(os.environ["OLLAMA_TIMEOUT"]) if os.environ.get("OLLAMA_TIMEOUT") else None
 
 _DEFAULT_DB_PATH = DATA_DIR / "journals.db"
 DATABASE_URL = os.environ.get("DATABASE_URL", f"sqlite:///{_DEFAULT_DB_PATH}")
 
+# Browser origins allowed to call the API cross-origin (comma-separated). The
+# bundled frontend is served by the API itself and needs no entry here.
+ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.environ.get(
+        "ALLOWED_ORIGINS", "http://localhost:8000,http://127.0.0.1:8000"
+    ).split(",")
+    if origin.strip()
+]
+
 # WHOOP OAuth Configuration
 WHOOP_CLIENT_ID = os.environ.get("WHOOP_CLIENT_ID", "")
 WHOOP_CLIENT_SECRET = os.environ.get("WHOOP_CLIENT_SECRET", "")
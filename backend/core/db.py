@@ -5,8 +5,9 @@ Database core utilities for journaling storage.
 from contextlib import contextmanager
 from typing import Iterator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from .config import DATABASE_URL
 
@@ -15,12 +16,40 @@ class Base(DeclarativeBase):
     """Shared declarative base for all ORM models."""
 
 
+_IS_SQLITE = DATABASE_URL.startswith("sqlite")
+
+# SQLite tuning applied to every new connection: WAL lets readers (context
+# building) proceed while a writer (ingest) holds the database, and NORMAL
+# sync is durable under WAL without an fsync per commit.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MiB memory-mapped I/O
+)
+
 engine = create_engine(
     DATABASE_URL,
     echo=False,  # flip to True when debugging SQL
     future=True,
+    poolclass=QueuePool,
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    # Pooled connections are handed to whichever thread checks them out
+    connect_args={"check_same_thread": False} if _IS_SQLITE else {},
 )
 
+
+if _IS_SQLITE:
+    @event.listens_for(engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
 SessionLocal = sessionmaker(
     bind=engine,
     autoflush=False,
@@ -34,6 +63,11 @@ def init_db() -> None:
     Create all tables registered on the declarative base.
     """
     Base.metadata.create_all(bind=engine)
+    # create_all skips tables that already exist, so add any indexes
+    # declared since those tables were created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
 
 
 @contextmanager
@@ -5,63 +5,122 @@ Lightweight data access helpers for journal storage.
 from __future__ import annotations
 
 import datetime as dt
+from collections import defaultdict
 from typing import Dict, List, Optional
 
 from sqlalchemy import func, select
-from sqlalchemy.orm import joinedload
 
 from backend.core.db import get_session
 from backend.models import Event, JournalEntry, JournalMetadata, Person
 
 
-def _serialize_entry(entry: JournalEntry) -> Dict:
-    meta: Optional[JournalMetadata] = entry.entry_metadata
-    return {
-        "id": entry.id,
-        "date": entry.entry_date,
-        "summary": meta.summary if meta else None,
-        "metrics": {
-            "mood_score": meta.mood_score if meta else None,
-            "energy_score": meta.energy_score if meta else None,
-            "stress_score": meta.stress_score if meta else None,
-            "sleep_hours": meta.sleep_hours if meta else None,
-        },
-        "events": [
+def list_entries_between(start: dt.date, end: dt.date) -> List[Dict]:
+    """
+    Return serialized entries between the two dates inclusive.
+
+    Reads plain row tuples (entries with metadata, then events, then people)
+    and assembles the dicts in one pass, without instantiating ORM objects.
+    """
+    in_window = JournalEntry.entry_date.between(start, end)
+    entry_query = (
+        select(
+            JournalEntry.id,
+            JournalEntry.entry_date,
+            JournalEntry.source_path,
+            JournalMetadata.summary,
+            JournalMetadata.mood_score,
+            JournalMetadata.energy_score,
+            JournalMetadata.stress_score,
+            JournalMetadata.sleep_hours,
+        )
+        .outerjoin(JournalMetadata, JournalMetadata.entry_id == JournalEntry.id)
+        .where(in_window)
+        .order_by(JournalEntry.entry_date.asc())
+    )
+    event_query = (
+        select(
+            Event.entry_id,
+            Event.id,
+            Event.description,
+            Event.category,
+            Event.effect_on_mood,
+        )
+        .join(JournalEntry, Event.entry_id == JournalEntry.id)
+        .where(in_window)
+        .order_by(Event.id)
+    )
+    people_query = (
+        select(Person.event_id, Person.name)
+        .join(Event, Person.event_id == Event.id)
+        .join(JournalEntry, Event.entry_id == JournalEntry.id)
+        .where(in_window)
+        .order_by(Person.id)
+    )
+
+    with get_session() as session:
+        entry_rows = session.execute(entry_query).all()
+        event_rows = session.execute(event_query).all()
+        people_rows = session.execute(people_query).all()
+
+    people_by_event: Dict[int, List[str]] = defaultdict(list)
+    for event_id, name in people_rows:
+        people_by_event[event_id].append(name)
+
+    events_by_entry: Dict[int, List[Dict]] = defaultdict(list)
+    for entry_id, event_id, description, category, effect_on_mood in event_rows:
+        events_by_entry[entry_id].append(
             {
-                "id": evt.id,
-                "description": evt.description,
-                "category": evt.category,
-                "effect_on_mood": evt.effect_on_mood,
-                "people": [person.name for person in evt.people],
+                "id": event_id,
+                "description": description,
+                "category": category,
+                "effect_on_mood": effect_on_mood,
+                "people": people_by_event.get(event_id, []),
             }
-            for evt in entry.events
-        ],
-        "source_path": entry.source_path,
-    }
+        )
 
+    return [
+        {
+            "id": entry_id,
+            "date": entry_date,
+            "summary": summary,
+            "metrics": {
+                "mood_score": mood,
+                "energy_score": energy,
+                "stress_score": stress,
+                "sleep_hours": sleep,
+            },
+            "events": events_by_entry.get(entry_id, []),
+            "source_path": source_path,
+        }
+        for entry_id, entry_date, source_path, summary, mood, energy, stress, sleep in entry_rows
+    ]
 
-def list_entries_between(start: dt.date, end: dt.date) -> List[Dict]:
+
+def average_metrics_between(start: dt.date, end: dt.date) -> Dict[str, Optional[float]]:
     """
-    Return serialized entries between the two dates inclusive.
+    Return per-metric averages (rounded to 2 decimals) for entries between the two
+    dates inclusive, computed in SQL. Metrics with no values average to None.
     """
     with get_session() as session:
         query = (
-            select(JournalEntry)
-            .options(
-                joinedload(JournalEntry.entry_metadata),
-                joinedload(JournalEntry.events).joinedload(Event.people),
+            select(
+                func.avg(JournalMetadata.mood_score),
+                func.avg(JournalMetadata.energy_score),
+                func.avg(JournalMetadata.stress_score),
+                func.avg(JournalMetadata.sleep_hours),
             )
+            .join(JournalEntry, JournalMetadata.entry_id == JournalEntry.id)
             .where(JournalEntry.entry_date.between(start, end))
-            .order_by(JournalEntry.entry_date.asc())
         )
-        rows = session.execute(query).unique().scalars().all()
-        return [_serialize_entry(row) for row in rows]
-
+        mood, energy, stress, sleep = session.execute(query).one()
 
-def list_recent_entries(days: int = 14) -> List[Dict]:
-    """
-    Convenience helper to fetch the most recent entries.
-    """
-    end = dt.date.today()
-    start = end - dt.timedelta(days=days)
-    return list_entries_between(start, end)
+    averages = {
+        "mood_score": mood,
+        "energy_score": energy,
+        "stress_score": stress,
+        "sleep_hours": sleep,
+    }
+    return {
+        key: round(float(value), 2) if value is not None else None
+        for key, value in averages.items()
+    }
@@ -0,0 +1,59 @@
+"""
+Database-backed storage for WHOOP OAuth tokens.
+
+Tokens live in the shared database rather than process memory, so every
+server worker sees the same login state.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+from backend.core.db import get_session
+from backend.models import WhoopToken
+
+DEFAULT_USER_ID = "default"
+TOKEN_FIELDS = ("access_token", "refresh_token", "expires_in", "scope", "oauth_state")
+
+
+def get_tokens(user_id: str = DEFAULT_USER_ID) -> Dict[str, Optional[object]]:
+    """
+    Return all stored token fields for the user (values are None when unset).
+    """
+    with get_session() as session:
+        row = session.get(WhoopToken, user_id)
+        return {field: getattr(row, field) if row else None for field in TOKEN_FIELDS}
+
+
+def get_token_field(field: str, user_id: str = DEFAULT_USER_ID) -> Optional[object]:
+    """
+    Return a single stored token field, or None when unset.
+    """
+    return get_tokens(user_id)[field]
+
+
+def set_token_fields(user_id: str = DEFAULT_USER_ID, **fields: Optional[object]) -> None:
+    """
+    Create or update the user's token row with the given fields.
+    """
+    unknown = set(fields) - set(TOKEN_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown token fields: {sorted(unknown)}")
+
+    with get_session() as session:
+        row = session.get(WhoopToken, user_id)
+        if row is None:
+            row = WhoopToken(user_id=user_id)
+            session.add(row)
+        for field, value in fields.items():
+            setattr(row, field, value)
+
+
+def clear_tokens(user_id: str = DEFAULT_USER_ID) -> None:
+    """
+    Delete all stored token fields for the user.
+    """
+    with get_session() as session:
+        row = session.get(WhoopToken, user_id)
+        if row is not None:
+            session.delete(row)
@@ -4,13 +4,53 @@ Batch ingest all Markdown notes within a directory.
 
 import argparse
 import datetime as dt
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional
-
-from backend.ingestion.ingest_journal import ingest_journal, _infer_date_from_filename
-
-
-def ingest_directory(notes_dir: Path, skip_if_unchanged: bool = True) -> None:
+from typing import Dict, List, Optional, Tuple
+
+from backend.core.db import get_session, init_db
+from backend.ingestion.ingest_journal import (
+    _decode_text,
+    _infer_date_from_filename,
+    _read_file,
+    is_unchanged,
+    persist_journal,
+)
+from backend.services.llm_client import extract_journal_metadata, extract_journal_metadata_batch
+
+DEFAULT_THREADS = max(1, (os.cpu_count() or 2) - 1)
+
+# Entries sent per extraction call, sharing one schema prompt between them
+DEFAULT_BATCH_SIZE = 4
+# Character budget per batched prompt, to stay well inside the model's context
+# window; longer entries are extracted on their own
+BATCH_MAX_CHARS = 6000
+
+_PendingFile = Tuple[Path, dt.date, str, str]
+
+
+def _extract_batch(texts: List[str]) -> List[dict]:
+    """Extract a group of entries, using the plain single-entry call for one."""
+    if len(texts) == 1:
+        return [extract_journal_metadata(texts[0])]
+    return extract_journal_metadata_batch(texts)
+
+
+def ingest_directory(
+    notes_dir: Path,
+    skip_if_unchanged: bool = True,
+    threads: int = DEFAULT_THREADS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> None:
+    """
+    Ingest every dated Markdown file under ``notes_dir``.
+
+    LLM extraction (the slow, network-bound step) runs on a thread pool, while
+    reads, skip checks and database writes stay serial on the calling thread.
+    Short entries are extracted ``batch_size`` at a time with one LLM call; a
+    batch whose response can't be used is retried entry by entry.
+    """
     paths = sorted(
         [p for p in notes_dir.glob("**/*.md") if p.is_file()],
         key=lambda p: p.name,
@@ -24,21 +64,74 @@ def ingest_directory(notes_dir: Path, skip_if_unchanged: bool = True) -> None:
     skipped = 0
     errors = 0
 
-    for path in paths:
-        entry_date: Optional[dt.date] = _infer_date_from_filename(path)
-        if entry_date is None:
-            print(f"Skipping {path} (no date in filename).")
-            skipped += 1
-            continue
-        try:
-            did_ingest = ingest_journal(path, entry_date, skip_if_unchanged=skip_if_unchanged)
-            if did_ingest:
-                processed += 1
-            else:
+    pending: Dict[Future, List[_PendingFile]] = {}
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        batch: List[_PendingFile] = []
+        batch_chars = 0
+
+        def submit(files: List[_PendingFile]) -> Future:
+            future = pool.submit(_extract_batch, [text for _, _, text, _ in files])
+            pending[future] = files
+            return future
+
+        for path in paths:
+            entry_date: Optional[dt.date] = _infer_date_from_filename(path)
+            if entry_date is None:
+                print(f"Skipping {path} (no date in filename).")
                 skipped += 1
-        except Exception as exc:  # pylint: disable=broad-except
-            print(f"Failed ingest for {path}: {exc}")
-            errors += 1
+                continue
+            try:
+                data, file_hash = _read_file(path)
+                if skip_if_unchanged and is_unchanged(path, file_hash):
+                    print(f"Skipping unchanged entry: {path}")
+                    skipped += 1
+                    continue
+                text = _decode_text(data)
+            except Exception as exc:  # pylint: disable=broad-except
+                print(f"Failed ingest for {path}: {exc}")
+                errors += 1
+                continue
+
+            if batch and batch_chars + len(text) > BATCH_MAX_CHARS:
+                submit(batch)
+                batch, batch_chars = [], 0
+            batch.append((path, entry_date, text, file_hash))
+            batch_chars += len(text)
+            if len(batch) >= batch_size:
+                submit(batch)
+                batch, batch_chars = [], 0
+        if batch:
+            submit(batch)
+
+        # Each file is persisted in its own short transaction. Holding one open
+        # across files would leave its SQLite snapshot stale once workers
+        # commit to the extraction cache, and the next write would fail with
+        # "database is locked".
+        remaining = set(pending)
+        while remaining:
+            done, remaining = wait(remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                files = pending.pop(future)
+                try:
+                    results = future.result()
+                except Exception as exc:  # pylint: disable=broad-except
+                    if len(files) > 1:
+                        # Fall back to one call per entry for an unusable batch
+                        print(f"Batch extraction failed, retrying entries individually: {exc}")
+                        remaining.update(submit([item]) for item in files)
+                        continue
+                    print(f"Failed ingest for {files[0][0]}: {exc}")
+                    errors += 1
+                    continue
+
+                for (path, entry_date, text, file_hash), metadata in zip(files, results):
+                    try:
+                        with get_session() as session:
+                            persist_journal(session, path, entry_date, text, file_hash, metadata)
+                        processed += 1
+                    except Exception as exc:  # pylint: disable=broad-except
+                        print(f"Failed ingest for {path}: {exc}")
+                        errors += 1
 
     print(
         f"Batch ingest complete. Processed: {processed}, skipped: {skipped}, errors: {errors}."
@@ -58,13 +151,33 @@ def main() -> None:
         action="store_true",
         help="Reingest even if files appear unchanged.",
     )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=DEFAULT_THREADS,
+        help=f"Parallel LLM extraction workers (default: {DEFAULT_THREADS}).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Entries extracted per LLM call; 1 disables batching (default: {DEFAULT_BATCH_SIZE}).",
+    )
     args = parser.parse_args()
 
+    # Make sure newer tables (e.g. the extraction cache) exist
+    init_db()
+
     notes_dir = args.notes_dir.expanduser().resolve()
     if not notes_dir.exists():
         raise SystemExit(f"Notes directory not found: {notes_dir}")
 
-    ingest_directory(notes_dir, skip_if_unchanged=not args.no_skip)
+    ingest_directory(
+        notes_dir,
+        skip_if_unchanged=not args.no_skip,
+        threads=args.threads,
+        batch_size=args.batch_size,
+    )
 
 
 if __name__ == "__main__":
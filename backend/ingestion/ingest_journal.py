@@ -7,9 +7,13 @@ import datetime as dt
 import hashlib
 import re
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
-from backend.core.db import get_session
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from backend.core.db import get_session, init_db
+from backend.services.context_builder import invalidate_context_cache
 from backend.services.llm_client import extract_journal_metadata
 from backend.models import Event, JournalEntry, JournalMetadata, Person
 
@@ -23,7 +27,14 @@ def _parse_date(value: Optional[str]) -> Optional[dt.date]:
 
 
 def _infer_date_from_filename(path: Path) -> Optional[dt.date]:
-    match = DATE_PATTERN.search(path.name)
+    name = path.name
+    # Fast path for the usual YYYY-MM-DD*.md naming, without the regex engine
+    if name[4:5] == "-" and name[7:8] == "-":
+        try:
+            return dt.date.fromisoformat(name[:10])
+        except ValueError:
+            pass
+    match = DATE_PATTERN.search(name)
     if not match:
         return None
     return dt.date.fromisoformat(match.group(0))
@@ -43,35 +54,74 @@ def _safe_float(value, default: float) -> float:
         return default
 
 
-def _content_hash(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+def _read_file(path: Path) -> Tuple[bytes, str]:
+    """
+    Read the file's raw bytes once and return them with their SHA-256, so the
+    skip check and the entry text share a single read.
+    """
+    data = path.read_bytes()
+    return data, hashlib.sha256(data).hexdigest()
 
 
-def ingest_journal(path: Path, entry_date: dt.date, skip_if_unchanged: bool = True) -> bool:
+def _decode_text(data: bytes) -> str:
     """
-    Ingest a single file. Returns True if processed (new or updated), False if skipped.
+    Decode file bytes as UTF-8 with the newline translation read_text applies.
     """
-    text = path.read_text(encoding="utf-8")
-    file_hash = _content_hash(text)
+    text = data.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
-    with get_session() as session:
-        existing = (
-            session.query(JournalEntry)
-            .filter(JournalEntry.source_path == str(path))
-            .one_or_none()
-        )
 
-        if existing and skip_if_unchanged and existing.file_hash == file_hash:
-            print(f"Skipping unchanged entry: {path}")
-            return False
+def is_unchanged(path: Path, file_hash: str) -> bool:
+    """
+    Return True if the file is already stored with the same content hash.
+    """
+    stmt = select(JournalEntry.id).where(
+        JournalEntry.source_path == str(path),
+        JournalEntry.file_hash == file_hash,
+    )
+    with get_session() as session:
+        return session.execute(stmt).first() is not None
 
-        metadata = extract_journal_metadata(text)
 
-        if existing:
-            print(f"Updating existing entry from {path}")
-            session.delete(existing)
-            session.flush()
+def persist_journal(
+    session: Session,
+    path: Path,
+    entry_date: dt.date,
+    text: str,
+    file_hash: str,
+    metadata: dict,
+) -> None:
+    """
+    Store an entry and its extracted metadata. An existing entry for the same path
+    is updated in place (keeping its id) and its events are replaced.
+    """
+    entry = (
+        session.query(JournalEntry)
+        .filter(JournalEntry.source_path == str(path))
+        .one_or_none()
+    )
 
+    entry_metadata: Optional[JournalMetadata] = None
+    if entry:
+        print(f"Updating existing entry from {path}")
+        invalidate_context_cache(entry.entry_date)
+        entry.entry_date = entry_date
+        entry.raw_text = text
+        entry.file_hash = file_hash
+        entry_metadata = entry.entry_metadata
+
+        # Replace events with two set-based deletes rather than loading and
+        # cascading through each child row
+        event_ids = select(Event.id).where(Event.entry_id == entry.id)
+        session.query(Person).filter(Person.event_id.in_(event_ids)).delete(
+            synchronize_session=False
+        )
+        session.query(Event).filter(Event.entry_id == entry.id).delete(
+            synchronize_session=False
+        )
+    else:
         entry = JournalEntry(
             entry_date=entry_date,
             source_path=str(path),
@@ -79,34 +129,69 @@ def ingest_journal(path: Path, entry_date: dt.date, skip_if_unchanged: bool = Tr
             file_hash=file_hash,
         )
         session.add(entry)
-        session.flush()
-
-        metrics = metadata.get("metrics") or {}
-        entry_metadata = JournalMetadata(
-            entry=entry,
-            summary=metadata.get("summary"),
-            mood_score=_safe_int(metrics.get("mood_score"), 5),
-            energy_score=_safe_int(metrics.get("energy_score"), 5),
-            stress_score=_safe_int(metrics.get("stress_score"), 5),
-            sleep_hours=_safe_float(metrics.get("sleep_hours"), 7.0),
-        )
-        session.add(entry_metadata)
 
-        for event_payload in metadata.get("events") or []:
-            event = Event(
-                entry=entry,
-                description=(event_payload.get("description") or "").strip(),
-                category=(event_payload.get("category") or "other").strip() or "other",
-                effect_on_mood=_safe_int(event_payload.get("effect on mood"), 0),
-            )
-            people = event_payload.get("people") or []
-            for person_name in people:
-                if not person_name:
-                    continue
-                event.people.append(Person(name=person_name.strip()))
-            session.add(event)
+    if entry_metadata is None:
+        entry_metadata = JournalMetadata(entry=entry)
+        session.add(entry_metadata)
 
+    metrics = metadata.get("metrics") or {}
+    entry_metadata.summary = metadata.get("summary")
+    entry_metadata.mood_score = _safe_int(metrics.get("mood_score"), 5)
+    entry_metadata.energy_score = _safe_int(metrics.get("energy_score"), 5)
+    entry_metadata.stress_score = _safe_int(metrics.get("stress_score"), 5)
+    entry_metadata.sleep_hours = _safe_float(metrics.get("sleep_hours"), 7.0)
+
+    # The only flush per entry (sessions don't autoflush): writes the entry and
+    # its metadata together and assigns entry.id for the event rows below
+    session.flush()
+
+    event_rows: List[dict] = []
+    event_people: List[List[str]] = []
+    for event_payload in metadata.get("events") or []:
+        event_rows.append({
+            "entry_id": entry.id,
+            "description": (event_payload.get("description") or "").strip(),
+            "category": (event_payload.get("category") or "other").strip() or "other",
+            "effect_on_mood": _safe_int(event_payload.get("effect on mood"), 0),
+        })
+        people = event_payload.get("people") or []
+        event_people.append([name.strip() for name in people if name])
+
+    # One executemany per table instead of a unit-of-work INSERT per object;
+    # RETURNING in parameter order maps the new event ids back to their people
+    if event_rows:
+        event_ids = session.scalars(
+            insert(Event).returning(Event.id, sort_by_parameter_order=True),
+            event_rows,
+        ).all()
+        person_rows = [
+            {"event_id": event_id, "name": name}
+            for event_id, names in zip(event_ids, event_people)
+            for name in names
+        ]
+        if person_rows:
+            session.execute(insert(Person), person_rows)
+
+    invalidate_context_cache(entry_date)
     print(f"Ingested journal for {entry_date.isoformat()} from {path}")
+
+
+def ingest_journal(path: Path, entry_date: dt.date, skip_if_unchanged: bool = True) -> bool:
+    """
+    Ingest a single file. Returns True if processed (new or updated), False if skipped.
+    """
+    # Decode only once the hash shows the file actually changed
+    data, file_hash = _read_file(path)
+
+    if skip_if_unchanged and is_unchanged(path, file_hash):
+        print(f"Skipping unchanged entry: {path}")
+        return False
+
+    text = _decode_text(data)
+    metadata = extract_journal_metadata(text)
+
+    with get_session() as session:
+        persist_journal(session, path, entry_date, text, file_hash, metadata)
     return True
 
 
@@ -125,6 +210,9 @@ def main() -> None:
     )
     args = parser.parse_args()
 
+    # Make sure newer tables (e.g. the extraction cache) exist
+    init_db()
+
     path: Path = args.path.expanduser().resolve()
     if not path.exists():
         raise SystemExit(f"File not found: {path}")
@@ -2,29 +2,54 @@
 FastAPI application entry point for the Journal Assistant.
 """
 
+from contextlib import asynccontextmanager
+
+import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import ORJSONResponse, Response
 from pathlib import Path
 
 from backend.api.chat import router as chat_router
 from backend.api.whoop_oauth import router as whoop_router
-from backend.api.whoop_data import router as whoop_data_router
+from backend.api.whoop_data import router as whoop_data_router, close_clients
+from backend.core.config import ALLOWED_ORIGINS
+from backend.core.db import init_db
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Create any missing tables (e.g. the WHOOP token store)
+    init_db()
+    # Shared connection pool for outbound calls (e.g. WHOOP token exchange)
+    app.state.httpx = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        http2=True,
+        timeout=30.0,
+    )
+    yield
+    await app.state.httpx.aclose()
+    await close_clients()
+
 
 app = FastAPI(
     title="JournaLLM",
     description="A privacy-focused AI journal assistant",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# Allow CORS for local development
+# Allow CORS from the configured origins only. No endpoint relies on cookies,
+# so credentials stay off, and browsers may cache preflights for a day.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
+    allow_origins=ALLOWED_ORIGINS,
+    allow_credentials=False,
+    allow_methods=["GET", "POST"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
 # Include API routes
@@ -32,18 +57,25 @@ app.include_router(chat_router)
 app.include_router(whoop_router)
 app.include_router(whoop_data_router)
 
+# Liveness probes hit this constantly, so the body is serialized once. The
+# handler stays async: a plain def would be dispatched to the threadpool.
+_HEALTH_BODY = b'{"status":"healthy"}'
+
+
+@app.get("/health")
+async def health_check():
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
 # Serve static frontend files
 FRONTEND_DIR = Path(__file__).resolve().parent.parent / "frontend"
 
 if FRONTEND_DIR.exists():
     app.mount("/static", StaticFiles(directory=FRONTEND_DIR), name="static")
 
+    # Read once at startup instead of opening and stat-ing the file per request
+    _INDEX_HTML = (FRONTEND_DIR / "index.html").read_bytes()
+
     @app.get("/")
     async def serve_frontend():
-        return FileResponse(FRONTEND_DIR / "index.html")
-
-
-@app.get("/health")
-async def health_check():
-    return {"status": "healthy"}
-
+        return Response(content=_INDEX_HTML, media_type="text/html")
@@ -8,6 +8,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -20,6 +21,8 @@ from backend.core.db import Base
 
 class JournalEntry(Base):
     __tablename__ = "journal_entries"
+    # Covers the ingest skip check (path + hash) without touching the table
+    __table_args__ = (Index("ix_entries_path_hash", "source_path", "file_hash"),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     entry_date = Column(Date, nullable=False)
@@ -81,3 +84,23 @@ class Person(Base):
 
     event = relationship("Event", back_populates="people")
 
+
+class WhoopToken(Base):
+    __tablename__ = "whoop_tokens"
+
+    user_id = Column(String(64), primary_key=True)
+    access_token = Column(Text, nullable=True)
+    refresh_token = Column(Text, nullable=True)
+    expires_in = Column(Integer, nullable=True)
+    scope = Column(String(255), nullable=True)
+    oauth_state = Column(String(64), nullable=True)
+
+
+class ExtractionCache(Base):
+    __tablename__ = "llm_cache"
+
+    input_hash = Column(String(64), primary_key=True)
+    prompt_version = Column(String(16), nullable=False)
+    model = Column(String(128), nullable=False)
+    response_json = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -1,5 +1,6 @@
 import sys
 from pathlib import Path
+from backend.core.db import init_db
 from backend.services.llm_client import extract_journal_metadata
 
 def main():
@@ -7,6 +8,9 @@ def main():
         print("Usage: python -m backend.scripts.test_extract path/to/journal.md")
         raise SystemExit(1)
 
+    # Make sure the extraction cache table exists
+    init_db()
+
     path = Path(sys.argv[1])
     text = path.read_text(encoding="utf-8")
 
@@ -7,50 +7,64 @@ from __future__ import annotations
 import datetime as dt
 from typing import Dict, List, Optional
 
-from backend.data_access.repository import list_entries_between, list_recent_entries
+from backend.core.cache import TTLCache
+from backend.data_access.repository import average_metrics_between, list_entries_between
 
+METRIC_KEYS = ("mood_score", "energy_score", "stress_score", "sleep_hours")
 
-def _avg(values: List[Optional[float]]) -> Optional[float]:
-    clean = [float(v) for v in values if isinstance(v, (int, float))]
-    if not clean:
-        return None
-    return round(sum(clean) / len(clean), 2)
+# Built context packages keyed by (kind, start ordinal, end ordinal). Ingest in
+# this process invalidates affected windows; the TTL bounds staleness when
+# entries are ingested by another process (e.g. the CLI).
+CONTEXT_CACHE_TTL = 60
+_context_cache = TTLCache(maxsize=128)
+
+
+def invalidate_context_cache(entry_date: dt.date) -> None:
+    """
+    Drop cached context packages whose window covers ``entry_date``.
+    """
+    day = entry_date.toordinal()
+    for key in _context_cache.keys():
+        _, start, end = key
+        if start <= day <= end:
+            _context_cache.pop(key)
 
 
 def _format_metric_line(metrics: Dict[str, Optional[float]]) -> str:
     parts = []
-    for key in ("mood_score", "energy_score", "stress_score", "sleep_hours"):
+    for key in METRIC_KEYS:
         value = metrics.get(key)
         if value is not None:
             parts.append(f"{key.replace('_', ' ').title()}: {value}")
     return " | ".join(parts) if parts else "No metrics available."
 
 
-def _build_context_payload(entries: List[Dict], coverage_line: str) -> Dict:
-    metrics = {
-        "mood_score": _avg([e["metrics"]["mood_score"] for e in entries if e.get("metrics")]),
-        "energy_score": _avg([e["metrics"]["energy_score"] for e in entries if e.get("metrics")]),
-        "stress_score": _avg([e["metrics"]["stress_score"] for e in entries if e.get("metrics")]),
-        "sleep_hours": _avg([e["metrics"]["sleep_hours"] for e in entries if e.get("metrics")]),
-    }
-
-    lines: List[str] = []
-    lines.append(coverage_line)
-    lines.append("Averages → " + _format_metric_line(metrics))
+def _build_context_payload(
+    entries: List[Dict],
+    metrics: Dict[str, Optional[float]],
+    coverage_line: str,
+) -> Dict:
+    lines: List[str] = [""] * (len(entries) + 2)
+    lines[0] = coverage_line
+    lines[1] = "Averages → " + _format_metric_line(metrics)
 
-    for entry in entries:
+    for i, entry in enumerate(entries, start=2):
         date_value = entry["date"]
-        date_str = date_value.strftime("%Y-%m-%d") if isinstance(date_value, dt.date) else str(date_value)
+        date_str = date_value.isoformat() if isinstance(date_value, dt.date) else str(date_value)
         summary = entry.get("summary") or "(no summary)"
-        events = entry.get("events") or []
-        top_event = events[0] if events else None
-        if top_event:
-            event_text = f"Key event: {top_event['description']}"
-            if top_event.get("people"):
-                event_text += f" (people: {', '.join(top_event['people'])})"
+        events = entry.get("events")
+        if not events:
+            lines[i] = f"- {date_str}: {summary} | No events captured."
+            continue
+        top_event = events[0]
+        people = top_event.get("people")
+        if people:
+            lines[i] = (
+                f"- {date_str}: {summary} | Key event: {top_event['description']} "
+                f"(people: {', '.join(people)})"
+            )
         else:
-            event_text = "No events captured."
-        lines.append(f"- {date_str}: {summary} | {event_text}")
+            lines[i] = f"- {date_str}: {summary} | Key event: {top_event['description']}"
 
     return {
         "entries": entries,
@@ -63,15 +77,25 @@ def build_recent_context(days: int = 14) -> Dict:
     """
     Fetch recent entries and return both structured data and formatted text snippets.
     """
-    entries = list_recent_entries(days=days)
+    end = dt.date.today()
+    start = end - dt.timedelta(days=days)
+    cache_key = ("recent", start.toordinal(), end.toordinal())
+    cached = _context_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    entries = list_entries_between(start, end)
     if entries:
         coverage_line = (
-            f"Recent journal coverage: {entries[0]['date']} to {entries[-1]['date']} "
+            f"Recent journal coverage: {entries[0]['date'].isoformat()} to {entries[-1]['date'].isoformat()} "
             f"({len(entries)} entries)."
         )
     else:
         coverage_line = "No journal entries stored yet."
-    return _build_context_payload(entries, coverage_line)
+    metrics = average_metrics_between(start, end)
+    payload = _build_context_payload(entries, metrics, coverage_line)
+    _context_cache.set(cache_key, payload, CONTEXT_CACHE_TTL)
+    return payload
 
 
 def build_context_window(
@@ -81,15 +105,23 @@ def build_context_window(
     """
     Build a context package for entries within an explicit date window.
     """
+    cache_key = ("window", start.toordinal(), end.toordinal())
+    cached = _context_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     entries = list_entries_between(start, end)
 
     if entries:
         coverage_line = (
-            f"Context window coverage: {entries[0]['date']} to {entries[-1]['date']} "
+            f"Context window coverage: {entries[0]['date'].isoformat()} to {entries[-1]['date'].isoformat()} "
             f"({len(entries)} entries)."
         )
     else:
-        coverage_line = f"No journal entries stored between {start} and {end}."
+        coverage_line = f"No journal entries stored between {start.isoformat()} and {end.isoformat()}."
 
-    return _build_context_payload(entries, coverage_line)
+    metrics = average_metrics_between(start, end)
+    payload = _build_context_payload(entries, metrics, coverage_line)
+    _context_cache.set(cache_key, payload, CONTEXT_CACHE_TTL)
+    return payload
 
@@ -0,0 +1,62 @@
+"""
+Content-addressed cache of LLM metadata extractions.
+
+Entries are keyed on the journal text together with the model and prompt
+version, so renamed or duplicated files reuse a previous extraction, while
+changing the model or bumping the prompt version invalidates old results.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Optional
+
+import orjson
+from sqlalchemy.exc import SQLAlchemyError
+
+from backend.core.db import get_session
+from backend.models import ExtractionCache
+
+
+def extraction_cache_key(text: str, model: str, prompt_version: str) -> str:
+    """
+    Return the cache key for extracting ``text`` with the given model and prompt.
+    """
+    digest = hashlib.sha256(f"{model}|{prompt_version}|".encode("utf-8"))
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def get_cached_extraction(key: str) -> Optional[dict]:
+    """
+    Return the cached extraction for ``key``, or None on a miss. An unusable
+    cache (e.g. a database created before the llm_cache table) counts as a miss.
+    """
+    try:
+        with get_session() as session:
+            row = session.get(ExtractionCache, key)
+            if row is None:
+                return None
+            return orjson.loads(row.response_json)
+    except SQLAlchemyError as exc:
+        print(f"Extraction cache lookup failed, treating as a miss: {getattr(exc, 'orig', None) or exc}")
+        return None
+
+
+def store_extraction(key: str, model: str, prompt_version: str, data: dict) -> None:
+    """
+    Cache an extraction result, replacing any previous value for ``key``.
+    Failing to store is not an error; the result just isn't cached.
+    """
+    try:
+        with get_session() as session:
+            session.merge(
+                ExtractionCache(
+                    input_hash=key,
+                    prompt_version=prompt_version,
+                    model=model,
+                    response_json=orjson.dumps(data).decode("utf-8"),
+                )
+            )
+    except SQLAlchemyError as exc:
+        print(f"Could not cache extraction: {getattr(exc, 'orig', None) or exc}")
@@ -4,14 +4,26 @@ All journal data stays on your machine.
 """
 
 import datetime as dt
-import json
 import re
-from typing import Sequence
+from typing import Iterator, Sequence
 
 import ollama
+import orjson
 
-from backend.core.config import OLLAMA_MODEL
+from backend.core.config import OLLAMA_HOST, OLLAMA_MODEL, OLLAMA_TIMEOUT
 from .context_builder import build_context_window
+from .extraction_cache import extraction_cache_key, get_cached_extraction, store_extraction
+
+# Shared Ollama client; reusing it keeps the underlying HTTP connection alive
+# across extraction and chat calls instead of rebuilding it per request. Its
+# httpx pool is thread-safe, so the ingest workers share it too.
+_client = ollama.Client(host=OLLAMA_HOST, timeout=OLLAMA_TIMEOUT)
+
+# Bump whenever EXTRACTION_SYSTEM_PROMPT changes so cached extractions are redone
+EXTRACTION_PROMPT_VERSION = "v1"
+# Multi-entry extractions come from a different prompt, so they are cached
+# under their own version and never served to single-entry callers
+EXTRACTION_BATCH_PROMPT_VERSION = f"{EXTRACTION_PROMPT_VERSION}-batch"
 
 # System prompt for journal metadata extraction
 EXTRACTION_SYSTEM_PROMPT = """You are extracting structured metadata from a personal daily journal entry.
@@ -46,6 +58,23 @@ Rules:
 
 Respond with ONLY the JSON object, nothing else."""
 
+# Static prefix of the extraction user message; only the entry text varies
+EXTRACTION_USER_PREFIX = "Here is the daily journal entry text:\n\n"
+
+# User-message header for multi-entry extraction; the system prompt is shared
+# with single-entry calls so Ollama can reuse its cached prefix
+EXTRACTION_BATCH_PREFIX = (
+    "Below are {count} daily journal entries, each headed \"### Entry N\". "
+    "Return a JSON object of the form {{\"entries\": [...]}} holding exactly one "
+    "object per entry, in the same order, each following the schema above.\n\n"
+)
+
+# Follow-up sent once when an extraction response is not a usable JSON object
+EXTRACTION_RETRY_PROMPT = (
+    "That response could not be parsed ({error}). "
+    "Respond with ONLY the corrected JSON object using the schema above."
+)
+
 # System prompt for journaling assistant
 ASSISTANT_SYSTEM_PROMPT = """You are a personal journaling assistant.
 You help the user reflect on their life, goals, emotions, and habits.
@@ -54,17 +83,28 @@ Just respond thoughtfully based on the user's current message.
 
 Keep answers concise and concrete."""
 
+# System prompt for chatting over a journal context window. Kept free of
+# per-request values so Ollama can reuse its cached prefix across chats;
+# the window dates go in the user message instead.
+CONTEXT_SYSTEM_PROMPT = """You are a personal journaling assistant.
+You have access to structured journal summaries for the date range given with the context.
+Use the provided context verbatim; do not fabricate details outside it.
+If the context does not mention something, say you are unsure.
+Keep answers concise, reflective, and actionable."""
+
+
+# Opening (with optional language tag) or closing markdown code fence the
+# model sometimes wraps its JSON in
+_FENCE_RE = re.compile(r"^```(?:json)?\s*\n?|\n?```\s*$")
+
 
 def _clean_json_response(raw_text: str) -> str:
     """Clean up LLM response to extract valid JSON."""
     raw_text = raw_text.strip()
     
-    # Remove markdown code fences if present
+    # Remove markdown code fences if present, in a single pass
     if raw_text.startswith("```"):
-        # Remove opening fence (with optional language tag)
-        raw_text = re.sub(r"^```(?:json)?\s*\n?", "", raw_text)
-        # Remove closing fence
-        raw_text = re.sub(r"\n?```\s*$", "", raw_text)
+        raw_text = _FENCE_RE.sub("", raw_text, count=2)
     
     # Find JSON object boundaries
     start = raw_text.find("{")
@@ -75,9 +115,38 @@ def _clean_json_response(raw_text: str) -> str:
     return raw_text.strip()
 
 
+def _parse_extraction(raw_text: str) -> dict:
+    """
+    Parse an extraction response, salvaging the JSON object if the model
+    wrapped it in extra text. Raises ValueError if no JSON object is found.
+    """
+    try:
+        data = orjson.loads(raw_text)
+    except orjson.JSONDecodeError:
+        data = orjson.loads(_clean_json_response(raw_text))
+    if not isinstance(data, dict):
+        raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+    return data
+
+
+def _parse_extraction_batch(raw_text: str, count: int) -> list[dict]:
+    """
+    Parse a multi-entry extraction response into one dict per entry.
+    Raises ValueError if it doesn't hold exactly ``count`` JSON objects.
+    """
+    data = orjson.loads(raw_text)
+    if isinstance(data, dict):
+        data = data.get("entries")
+    if not isinstance(data, list) or len(data) != count:
+        raise ValueError(f"expected a list of {count} entries")
+    if not all(isinstance(item, dict) for item in data):
+        raise ValueError("expected every entry to be a JSON object")
+    return data
+
+
 def _chat(system_prompt: str, user_message: str) -> str:
     """Send a chat message to Ollama and return the response."""
-    response = ollama.chat(
+    response = _client.chat(
         model=OLLAMA_MODEL,
         messages=[
             {"role": "system", "content": system_prompt},
@@ -87,33 +156,113 @@ def _chat(system_prompt: str, user_message: str) -> str:
     return response["message"]["content"].strip()
 
 
+def _chat_stream(system_prompt: str, user_message: str) -> Iterator[str]:
+    """Send a chat message to Ollama and yield the response as it is generated."""
+    stream = _client.chat(
+        model=OLLAMA_MODEL,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_message},
+        ],
+        stream=True,
+    )
+    for chunk in stream:
+        content = chunk["message"]["content"]
+        if content:
+            yield content
+
+
 def extract_journal_metadata(journal_text: str) -> dict:
     """
     Use local Ollama model to extract structured data from a journal entry.
     This keeps sensitive journal data on your local machine.
+    Results are cached by content, so identical text is only extracted once.
     Returns a Python dict.
     """
-    prompt = f"Here is the daily journal entry text:\n\n{journal_text}"
+    cache_key = extraction_cache_key(journal_text, OLLAMA_MODEL, EXTRACTION_PROMPT_VERSION)
+    cached = get_cached_extraction(cache_key)
+    if cached is not None:
+        return cached
+
+    messages = [
+        {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
+        {"role": "user", "content": EXTRACTION_USER_PREFIX + journal_text},
+    ]
+
+    # JSON mode constrains decoding to a JSON value, so no prose or fences to strip
+    response = _client.chat(model=OLLAMA_MODEL, messages=messages, format="json")
+    raw_text = response["message"]["content"]
+
+    try:
+        data = _parse_extraction(raw_text)
+    except ValueError as e:
+        # Retry once, showing the model its output and why it was rejected
+        messages.append({"role": "assistant", "content": raw_text})
+        messages.append({"role": "user", "content": EXTRACTION_RETRY_PROMPT.format(error=e)})
+        response = _client.chat(model=OLLAMA_MODEL, messages=messages, format="json")
+        raw_text = response["message"]["content"]
+        try:
+            data = _parse_extraction(raw_text)
+        except ValueError as e:
+            raise RuntimeError(
+                f"Failed to parse Ollama JSON: {e}\nRaw: {raw_text[:500]}"
+            )
+
+    store_extraction(cache_key, OLLAMA_MODEL, EXTRACTION_PROMPT_VERSION, data)
+    return data
+
+
+def extract_journal_metadata_batch(journal_texts: Sequence[str]) -> list[dict]:
+    """
+    Extract metadata for several journal entries with a single Ollama call, so
+    the schema prompt is prefilled once per batch instead of once per entry.
+    Entries with a cached single-entry or batch extraction are served from the
+    cache; only misses are sent, and their results are cached as batch output.
+    Returns one dict per input text, in order. Raises RuntimeError if the
+    response can't be split into one object per entry; callers should fall
+    back to extract_journal_metadata.
+    """
+    keys = [
+        extraction_cache_key(text, OLLAMA_MODEL, EXTRACTION_BATCH_PROMPT_VERSION)
+        for text in journal_texts
+    ]
+    results = [
+        get_cached_extraction(
+            extraction_cache_key(text, OLLAMA_MODEL, EXTRACTION_PROMPT_VERSION)
+        )
+        or get_cached_extraction(key)
+        for text, key in zip(journal_texts, keys)
+    ]
+    missing = [idx for idx, cached in enumerate(results) if cached is None]
+    if not missing:
+        return results
+
+    prompt = EXTRACTION_BATCH_PREFIX.format(count=len(missing)) + "\n\n".join(
+        f"### Entry {number}\n\n{journal_texts[idx]}"
+        for number, idx in enumerate(missing, start=1)
+    )
 
-    response = ollama.chat(
+    response = _client.chat(
         model=OLLAMA_MODEL,
         messages=[
             {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
             {"role": "user", "content": prompt},
         ],
+        format="json",
     )
-    
     raw_text = response["message"]["content"]
-    cleaned = _clean_json_response(raw_text)
 
     try:
-        data = json.loads(cleaned)
-    except json.JSONDecodeError as e:
+        extracted = _parse_extraction_batch(raw_text, len(missing))
+    except ValueError as e:
         raise RuntimeError(
-            f"Failed to parse Ollama JSON: {e}\nRaw: {raw_text[:500]}"
+            f"Failed to parse Ollama batch JSON: {e}\nRaw: {raw_text[:500]}"
         )
 
-    return data
+    for idx, data in zip(missing, extracted):
+        store_extraction(keys[idx], OLLAMA_MODEL, EXTRACTION_BATCH_PROMPT_VERSION, data)
+        results[idx] = data
+    return results
 
 
 def chat_with_journal_assistant(message: str) -> str:
@@ -124,15 +273,14 @@ def chat_with_journal_assistant(message: str) -> str:
     return _chat(ASSISTANT_SYSTEM_PROMPT, message)
 
 
-def chat_with_journal_context(
+def _build_context_prompts(
     message: str,
     start_date: dt.date | str,
     end_date: dt.date | str,
     history: Sequence[tuple[str, str]] | None = None,
-) -> str:
+) -> tuple[str, str]:
     """
-    Chat with the assistant using journal context from the specified date window.
-    All processing happens locally via Ollama for privacy.
+    Build the (system prompt, user message) pair for a context-window chat.
     """
     window_start = _ensure_date(start_date)
     window_end = _ensure_date(end_date)
@@ -140,33 +288,52 @@ def chat_with_journal_context(
     context = build_context_window(window_start, window_end)
     context_text = context["text"]
 
-    system_prompt = f"""You are a personal journaling assistant.
-You have access to structured journal summaries covering {window_start} to {window_end}.
-Use the provided context verbatim; do not fabricate details outside it.
-If the context does not mention something, say you are unsure.
-Keep answers concise, reflective, and actionable."""
-
     # Build the user message with context and history
-    parts = []
-    parts.append("=== Journal Context Start ===")
-    parts.append(context_text)
-    parts.append("=== Journal Context End ===")
-    parts.append("")
-
+    history_text = ""
     if history:
-        parts.append("Conversation history:")
-        for idx, (user_msg, assistant_msg) in enumerate(history, start=1):
-            parts.append(f"{idx}. User: {user_msg}")
-            parts.append(f"{idx}. Assistant: {assistant_msg}")
-        parts.append("")
+        history_lines = "\n".join(
+            f"{idx}. User: {user_msg}\n{idx}. Assistant: {assistant_msg}"
+            for idx, (user_msg, assistant_msg) in enumerate(history, start=1)
+        )
+        history_text = f"Conversation history:\n{history_lines}\n\n"
+
+    user_content = (
+        f"Journal context covers {window_start.isoformat()} to {window_end.isoformat()}.\n"
+        f"=== Journal Context Start ===\n{context_text}\n=== Journal Context End ===\n\n"
+        f"{history_text}User question: {message}"
+    )
 
-    parts.append(f"User question: {message}")
+    return CONTEXT_SYSTEM_PROMPT, user_content
 
-    user_content = "\n".join(parts)
 
+def chat_with_journal_context(
+    message: str,
+    start_date: dt.date | str,
+    end_date: dt.date | str,
+    history: Sequence[tuple[str, str]] | None = None,
+) -> str:
+    """
+    Chat with the assistant using journal context from the specified date window.
+    All processing happens locally via Ollama for privacy.
+    """
+    system_prompt, user_content = _build_context_prompts(message, start_date, end_date, history)
     return _chat(system_prompt, user_content)
 
 
+def stream_chat_with_journal_context(
+    message: str,
+    start_date: dt.date | str,
+    end_date: dt.date | str,
+    history: Sequence[tuple[str, str]] | None = None,
+) -> Iterator[str]:
+    """
+    Streaming variant of chat_with_journal_context that yields response text chunks
+    as the model generates them.
+    """
+    system_prompt, user_content = _build_context_prompts(message, start_date, end_date, history)
+    yield from _chat_stream(system_prompt, user_content)
+
+
 def _ensure_date(value: dt.date | str) -> dt.date:
     if isinstance(value, dt.date):
         return value
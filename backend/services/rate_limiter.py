@@ -0,0 +1,136 @@
+"""
+Client-side rate limiting for outbound API calls.
+
+Combines three layers:
+- a proactive sliding-window cap on requests per window,
+- an AIMD (additive-increase / multiplicative-decrease) concurrency limit that
+  backs off on 429/5xx responses and slowly recovers on success,
+- header-reactive pauses driven by ``Retry-After`` / ``X-RateLimit-*`` headers.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Optional
+
+import httpx
+
+
+class AIMDController:
+    """Concurrency limit adjusted by additive increase / multiplicative decrease."""
+
+    def __init__(
+        self,
+        initial: float = 8,
+        minimum: float = 1,
+        maximum: float = 64,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+    ):
+        self.limit = float(initial)
+        self.minimum = float(minimum)
+        self.maximum = float(maximum)
+        self.increase = increase
+        self.decrease = decrease
+
+    def update(self, error: bool) -> None:
+        """Grow the limit by ``increase`` on success, scale it by ``decrease`` on error."""
+        if error:
+            self.limit = max(self.minimum, self.limit * self.decrease)
+        else:
+            self.limit = min(self.maximum, self.limit + self.increase)
+
+
+def _header_int(response: httpx.Response, name: str) -> Optional[int]:
+    """Parse the leading integer of a header such as ``100, 100;window=60``."""
+    value = response.headers.get(name)
+    if not value:
+        return None
+    try:
+        return int(float(value.split(",")[0].split(";")[0].strip()))
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """
+    Gate for outbound requests to a rate-limited API.
+
+    Usage:
+        limiter = RateLimiter(max_requests=100, window=60.0)
+        response = await limiter.send(lambda: client.get(url))
+    """
+
+    def __init__(
+        self,
+        max_requests: int = 100,
+        window: float = 60.0,
+        controller: Optional[AIMDController] = None,
+        low_remaining_ratio: float = 0.1,
+    ):
+        self.max_requests = max_requests
+        self.window = window
+        self.controller = controller or AIMDController()
+        self.low_remaining_ratio = low_remaining_ratio
+        self._timestamps: Deque[float] = deque()
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._slots = asyncio.Condition()
+
+    async def send(self, request: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """Run ``request`` once a concurrency slot and window budget are available."""
+        await self._acquire()
+        error = True
+        try:
+            response = await request()
+            error = response.status_code == 429 or response.status_code >= 500
+            self._observe(response)
+            return response
+        finally:
+            self.controller.update(error)
+            await self._release()
+
+    async def _acquire(self) -> None:
+        async with self._slots:
+            await self._slots.wait_for(lambda: self._in_flight < int(self.controller.limit))
+            self._in_flight += 1
+
+        # The slot is taken before waiting on the window; give it back if the
+        # wait is cancelled, or it would be lost to the shared limiter for good
+        try:
+            while True:
+                now = time.monotonic()
+                while self._timestamps and self._timestamps[0] <= now - self.window:
+                    self._timestamps.popleft()
+
+                delay = self._paused_until - now
+                if len(self._timestamps) >= self.max_requests:
+                    delay = max(delay, self._timestamps[0] + self.window - now)
+                if delay <= 0:
+                    self._timestamps.append(now)
+                    return
+                await asyncio.sleep(delay)
+        except BaseException:
+            await self._release()
+            raise
+
+    async def _release(self) -> None:
+        async with self._slots:
+            self._in_flight -= 1
+            self._slots.notify_all()
+
+    def _observe(self, response: httpx.Response) -> None:
+        """Pause future requests when the server says we are (nearly) out of quota."""
+        pause = None
+        if response.status_code == 429:
+            pause = _header_int(response, "Retry-After") or _header_int(response, "X-RateLimit-Reset")
+            if pause is None:
+                pause = 1
+        else:
+            remaining = _header_int(response, "X-RateLimit-Remaining")
+            limit = _header_int(response, "X-RateLimit-Limit")
+            if remaining is not None and limit and remaining < limit * self.low_remaining_ratio:
+                pause = _header_int(response, "X-RateLimit-Reset")
+
+        if pause:
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
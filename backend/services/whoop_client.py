@@ -9,19 +9,85 @@ API Reference:
 - User: https://developer.whoop.com/docs/developing/user-data/user
 """
 
-from datetime import date, datetime
-from typing import Optional, List, Any
+import asyncio
+from datetime import date, datetime, timedelta
+from operator import attrgetter
+from typing import Optional, List, Any, Awaitable, Callable, ClassVar, Generic, Hashable, Literal, TypeVar
 
 import httpx
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, PrivateAttr, TypeAdapter
 
+from backend.core.cache import TTLCache
 from backend.core.config import WHOOP_API_BASE_URL
+from backend.services.rate_limiter import RateLimiter
+
+# Shared by all clients so concurrent pagination (e.g. the combined summary)
+# stays within WHOOP's quota of 100 requests per minute
+_RATE_LIMITER = RateLimiter(max_requests=100, window=60.0)
+
+# Retries for requests rejected with 429; the limiter waits out Retry-After first
+_MAX_RATE_LIMIT_RETRIES = 2
+
+# Page requests a single client keeps in flight while paginating
+_PAGINATION_CONCURRENCY = 8
+
+# Response bodies cached per client, keyed by endpoint and params
+_RESPONSE_CACHE_SIZE = 512
+# Cache lifetime (seconds) for responses that may still change
+_RECENT_TTL = 60
+# WHOOP keeps rescoring recent days; data older than this is treated as final
+_SETTLED_AFTER = timedelta(days=2)
+
+# Days per date-range shard in get_all_*; at roughly one record per day this
+# is about one page, so each shard usually costs a single request
+_SHARD_DAYS = 25
+
+
+def _cache_ttl(params: Optional[dict]) -> Optional[float]:
+    """
+    Cache lifetime for a response: ranges ending before the settle window are
+    final and never expire, anything else is cached briefly.
+    """
+    end = params.get("end") if params else None
+    if end and date.fromisoformat(end[:10]) < date.today() - _SETTLED_AFTER:
+        return None
+    return _RECENT_TTL
+
+
+def _iso_start(day: date) -> str:
+    """UTC timestamp for the first millisecond of ``day``."""
+    return day.isoformat() + "T00:00:00.000Z"
+
+
+def _iso_end(day: date) -> str:
+    """UTC timestamp for the last millisecond of ``day``."""
+    return day.isoformat() + "T23:59:59.999Z"
+
+
+def _split_ranges(start: date, end: date, days: int) -> List[tuple[date, date]]:
+    """
+    Split the inclusive range [start, end] into consecutive inclusive ranges of
+    at most ``days`` days, newest first to match WHOOP's record ordering.
+    """
+    ranges = []
+    shard_end = end
+    while shard_end >= start:
+        shard_start = max(start, shard_end - timedelta(days=days - 1))
+        ranges.append((shard_start, shard_end))
+        shard_end = shard_start - timedelta(days=1)
+    return ranges
 
 
 # =============================================================================
 # Pydantic Models for WHOOP API Responses
 # =============================================================================
 
+# Scoring status WHOOP reports on cycles, sleep, recovery and workouts; score
+# is only present when SCORED
+ScoreState = Literal["SCORED", "PENDING_SCORE", "UNSCORABLE"]
+
+
 class UserProfile(BaseModel):
     """User basic profile information."""
     user_id: int
@@ -52,7 +118,7 @@ class Cycle(BaseModel):
     start: datetime
     end: Optional[datetime] = None
     timezone_offset: str
-    score_state: str
+    score_state: ScoreState
     score: Optional[CycleScore] = None
 
 
@@ -95,7 +161,7 @@ class Sleep(BaseModel):
     end: datetime
     timezone_offset: str
     nap: bool
-    score_state: str
+    score_state: ScoreState
     score: Optional[SleepScore] = None
 
 
@@ -114,7 +180,7 @@ class Recovery(BaseModel):
     cycle_id: int
     sleep_id: str
     user_id: int
-    score_state: str
+    score_state: ScoreState
     score: Optional[RecoveryScore] = None
 
 
@@ -150,16 +216,121 @@ class Workout(BaseModel):
     timezone_offset: str
     sport_name: str
     sport_id: Optional[int] = None
-    score_state: str
+    score_state: ScoreState
     score: Optional[WorkoutScore] = None
 
 
-class PaginatedResponse(BaseModel):
-    """Generic paginated response from WHOOP API."""
-    records: List[Any]
+class _LazyScore(BaseModel):
+    """
+    Mixin for "lite" records that keep ``score`` as the raw JSON object and
+    validate it only when scored() is first called. Lite records are declared
+    standalone rather than as subclasses of the full models, so code that
+    checks isinstance(record, Cycle) never gets one with a dict score.
+    """
+    _score_model: ClassVar[type[BaseModel]]
+    _scored: Optional[BaseModel] = PrivateAttr(default=None)
+    
+    def scored(self):
+        """Return the validated score model (None if unscored), cached after first use."""
+        if self._scored is None and self.score is not None:
+            self._scored = self._score_model.model_validate(self.score)
+        return self._scored
+
+
+class CycleLite(_LazyScore):
+    """Cycle whose score is validated on demand via scored()."""
+    _score_model = CycleScore
+    
+    id: int
+    user_id: int
+    start: datetime
+    end: Optional[datetime] = None
+    timezone_offset: str
+    score_state: ScoreState
+    score: Optional[dict] = None
+
+
+class SleepLite(_LazyScore):
+    """Sleep record whose score is validated on demand via scored()."""
+    _score_model = SleepScore
+    
+    id: str
+    user_id: int
+    cycle_id: int
+    start: datetime
+    end: datetime
+    timezone_offset: str
+    nap: bool
+    score_state: ScoreState
+    score: Optional[dict] = None
+
+
+class RecoveryLite(_LazyScore):
+    """Recovery record whose score is validated on demand via scored()."""
+    _score_model = RecoveryScore
+    
+    cycle_id: int
+    sleep_id: str
+    user_id: int
+    score_state: ScoreState
+    score: Optional[dict] = None
+
+
+class WorkoutLite(_LazyScore):
+    """Workout whose score is validated on demand via scored()."""
+    _score_model = WorkoutScore
+    
+    id: str
+    user_id: int
+    start: datetime
+    end: datetime
+    timezone_offset: str
+    sport_name: str
+    sport_id: Optional[int] = None
+    score_state: ScoreState
+    score: Optional[dict] = None
+
+
+class SyncResult(BaseModel):
+    """Every record type for one date range, as returned by WhoopClient.get_all."""
+    cycles: List[Cycle | CycleLite]
+    sleep: List[Sleep | SleepLite]
+    recovery: List[Recovery | RecoveryLite]
+    workouts: List[Workout | WorkoutLite]
+
+
+RecordT = TypeVar("RecordT")
+
+
+class _RecordPage(BaseModel, Generic[RecordT]):
+    """One page of a paginated collection endpoint."""
+    records: List[RecordT] = []
     next_token: Optional[str] = None
 
 
+# Pages are validated straight from the response bytes: pydantic-core parses
+# and validates in one pass, with no intermediate dict
+_CYCLE_PAGE = TypeAdapter(_RecordPage[Cycle])
+_SLEEP_PAGE = TypeAdapter(_RecordPage[Sleep])
+_RECOVERY_PAGE = TypeAdapter(_RecordPage[Recovery])
+_WORKOUT_PAGE = TypeAdapter(_RecordPage[Workout])
+
+# Lite pages skip nested score validation, for scans that rarely read scores
+_CYCLE_LITE_PAGE = TypeAdapter(_RecordPage[CycleLite])
+_SLEEP_LITE_PAGE = TypeAdapter(_RecordPage[SleepLite])
+_RECOVERY_LITE_PAGE = TypeAdapter(_RecordPage[RecoveryLite])
+_WORKOUT_LITE_PAGE = TypeAdapter(_RecordPage[WorkoutLite])
+
+# Debug probes in flight at once
+_DEBUG_CONCURRENCY = 6
+
+# Read size when streaming a debug preview; previews need well under 1 KiB
+_PREVIEW_CHUNK_SIZE = 1024
+
+# Body returned in place of a 404, which some endpoints send for empty queries
+_EMPTY_PAGE = b'{"records": []}'
+
+
 # =============================================================================
 # WHOOP API Client
 # =============================================================================
@@ -172,13 +343,42 @@ class WhoopClient:
         from backend.api.whoop_oauth import get_access_token
         
         token = get_access_token()
-        client = WhoopClient(token)
-        profile = await client.get_profile()
+        async with WhoopClient(token) as client:
+            profile = await client.get_profile()
     """
     
-    def __init__(self, access_token: str):
+    # Largest page WHOOP's collection endpoints accept; larger limits get a 400
+    MAX_PAGE = 25
+    
+    def __init__(self, access_token: str, validate_scores: bool = True):
         self.access_token = access_token
+        # When False, records are the *Lite variants and scores stay raw dicts
+        # until scored() is called
+        self.validate_scores = validate_scores
         self.base_url = WHOOP_API_BASE_URL
+        # Reused across requests so paginated calls keep their connections
+        # alive; HTTP/2 multiplexes concurrent requests over one connection
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self._headers(),
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            timeout=httpx.Timeout(30.0),
+        )
+        # (ETag, body) per (endpoint, params)
+        self._cache = TTLCache(maxsize=_RESPONSE_CACHE_SIZE)
+        # Caps page requests in flight across this client's sharded pagination
+        self._page_semaphore = asyncio.Semaphore(_PAGINATION_CONCURRENCY)
+    
+    async def __aenter__(self) -> "WhoopClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
     
     def _headers(self) -> dict:
         """Build authorization headers."""
@@ -187,16 +387,101 @@ class WhoopClient:
             "Content-Type": "application/json",
         }
     
+    async def _get_bytes(self, endpoint: str, params: dict = None) -> bytes:
+        """
+        Make a GET request to the WHOOP API and return the raw JSON body.
+
+        Bodies are cached per (endpoint, params); once an entry expires it is
+        revalidated with If-None-Match, and a 304 reuses the cached body.
+        """
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached[1]
+
+        stale = self._cache.get_stale(key)
+        headers = {"If-None-Match": stale[0]} if stale and stale[0] else None
+        for _ in range(_MAX_RATE_LIMIT_RETRIES + 1):
+            response = await _RATE_LIMITER.send(
+                lambda: self._client.get(endpoint, params=params, headers=headers)
+            )
+            if response.status_code != 429:
+                break
+
+        etag = response.headers.get("ETag")
+        if response.status_code == 304 and stale is not None:
+            etag = etag or stale[0]
+            body = stale[1]
+        # Some endpoints return 404 when no data exists for the query
+        elif response.status_code == 404:
+            body = _EMPTY_PAGE
+        else:
+            response.raise_for_status()
+            body = response.content
+
+        self._cache.set(key, (etag, body), _cache_ttl(params))
+        return body
+    
+    def cache_clear(self) -> None:
+        """Drop every cached response body."""
+        self._cache.clear()
+    
     async def _get(self, endpoint: str, params: dict = None) -> dict:
         """Make a GET request to the WHOOP API."""
-        url = f"{self.base_url}{endpoint}"
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self._headers(), params=params)
-            # Some endpoints return 404 when no data exists for the query
-            if response.status_code == 404:
-                return {"records": []}
-            response.raise_for_status()
-            return response.json()
+        return orjson.loads(await self._get_bytes(endpoint, params))
+    
+    @staticmethod
+    def _build_params(
+        start_date: Optional[date],
+        end_date: Optional[date],
+        limit: int,
+        next_token: Optional[str],
+    ) -> dict:
+        """Query params for a collection endpoint, omitting unset filters."""
+        params = {"limit": limit}
+        if start_date:
+            params["start"] = _iso_start(start_date)
+        if end_date:
+            params["end"] = _iso_end(end_date)
+        if next_token:
+            params["nextToken"] = next_token
+        return params
+    
+    async def _fetch_page(
+        self,
+        endpoint: str,
+        adapter: TypeAdapter[_RecordPage[RecordT]],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        limit: int,
+        next_token: Optional[str],
+    ) -> tuple[List[RecordT], Optional[str]]:
+        """Fetch and validate one page of a collection endpoint."""
+        params = self._build_params(start_date, end_date, limit, next_token)
+        page = adapter.validate_json(await self._get_bytes(endpoint, params))
+        return page.records, page.next_token
+    
+    async def _preview(self, endpoint: str, params: dict) -> dict:
+        """
+        GET ``endpoint`` and report its status with a short preview of the body,
+        streaming only as many bytes as the preview needs.
+        """
+        # Probes count against the same quota as data requests, so they go
+        # through the shared limiter too
+        request = self._client.build_request("GET", endpoint, params=params)
+        response = await _RATE_LIMITER.send(lambda: self._client.send(request, stream=True))
+        try:
+            length = 200 if response.status_code == 200 else 100
+            head = b""
+            # UTF-8 needs at most 4 bytes per character
+            async for chunk in response.aiter_bytes(_PREVIEW_CHUNK_SIZE):
+                head += chunk
+                if len(head) >= length * 4:
+                    break
+        finally:
+            await response.aclose()
+        text = head.decode(response.charset_encoding or "utf-8", errors="ignore")
+        return {"status": response.status_code, "preview": text[:length]}
     
     async def debug_endpoints(self) -> dict:
         """Test various endpoint paths to find the correct ones."""
@@ -215,24 +500,18 @@ class WhoopClient:
             "/v2/activity/workout",
         ]
         
-        results = {}
-        async with httpx.AsyncClient() as client:
-            for endpoint in endpoints_to_test:
-                url = f"{self.base_url}{endpoint}"
+        semaphore = asyncio.Semaphore(_DEBUG_CONCURRENCY)
+        
+        async def probe(endpoint: str) -> dict:
+            async with semaphore:
                 try:
-                    response = await client.get(
-                        url, 
-                        headers=self._headers(), 
-                        params={"limit": 1}
-                    )
-                    results[endpoint] = {
-                        "status": response.status_code,
-                        "preview": response.text[:200] if response.status_code == 200 else response.text[:100]
-                    }
+                    return await self._preview(endpoint, {"limit": 1})
                 except Exception as e:
-                    results[endpoint] = {"status": "error", "preview": str(e)}
+                    return {"status": "error", "preview": str(e)}
         
-        return results
+        # The probes are independent, so overlap their round trips
+        previews = await asyncio.gather(*(probe(endpoint) for endpoint in endpoints_to_test))
+        return dict(zip(endpoints_to_test, previews))
     
     # -------------------------------------------------------------------------
     # User Endpoints
@@ -244,7 +523,7 @@ class WhoopClient:
         GET /v1/user/profile/basic
         """
         data = await self._get("/v1/user/profile/basic")
-        return UserProfile(**data)
+        return UserProfile.model_validate(data)
     
     async def get_body_measurement(self) -> BodyMeasurement:
         """
@@ -252,7 +531,7 @@ class WhoopClient:
         GET /v1/user/measurement/body
         """
         data = await self._get("/v1/user/measurement/body")
-        return BodyMeasurement(**data)
+        return BodyMeasurement.model_validate(data)
     
     # -------------------------------------------------------------------------
     # Cycle Endpoints
@@ -262,9 +541,9 @@ class WhoopClient:
         self,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-        limit: int = 25,
+        limit: int = MAX_PAGE,
         next_token: Optional[str] = None,
-    ) -> tuple[List[Cycle], Optional[str]]:
+    ) -> tuple[List[Cycle | CycleLite], Optional[str]]:
         """
         Get physiological cycles.
         GET /v1/cycle
@@ -272,17 +551,10 @@ class WhoopClient:
         Returns:
             Tuple of (list of cycles, next_token for pagination)
         """
-        params = {"limit": limit}
-        if start_date:
-            params["start"] = f"{start_date}T00:00:00.000Z"
-        if end_date:
-            params["end"] = f"{end_date}T23:59:59.999Z"
-        if next_token:
-            params["nextToken"] = next_token
-        
-        data = await self._get("/v1/cycle", params)
-        cycles = [Cycle(**record) for record in data.get("records", [])]
-        return cycles, data.get("next_token")
+        adapter = _CYCLE_PAGE if self.validate_scores else _CYCLE_LITE_PAGE
+        return await self._fetch_page(
+            "/v1/cycle", adapter, start_date, end_date, limit, next_token
+        )
     
     # -------------------------------------------------------------------------
     # Sleep Endpoints
@@ -292,9 +564,9 @@ class WhoopClient:
         self,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-        limit: int = 25,
+        limit: int = MAX_PAGE,
         next_token: Optional[str] = None,
-    ) -> tuple[List[Sleep], Optional[str]]:
+    ) -> tuple[List[Sleep | SleepLite], Optional[str]]:
         """
         Get sleep activities.
         GET /v2/activity/sleep
@@ -302,17 +574,10 @@ class WhoopClient:
         Returns:
             Tuple of (list of sleep records, next_token for pagination)
         """
-        params = {"limit": limit}
-        if start_date:
-            params["start"] = f"{start_date}T00:00:00.000Z"
-        if end_date:
-            params["end"] = f"{end_date}T23:59:59.999Z"
-        if next_token:
-            params["nextToken"] = next_token
-        
-        data = await self._get("/v2/activity/sleep", params)
-        sleep_records = [Sleep(**record) for record in data.get("records", [])]
-        return sleep_records, data.get("next_token")
+        adapter = _SLEEP_PAGE if self.validate_scores else _SLEEP_LITE_PAGE
+        return await self._fetch_page(
+            "/v2/activity/sleep", adapter, start_date, end_date, limit, next_token
+        )
     
     # -------------------------------------------------------------------------
     # Recovery Endpoints
@@ -322,9 +587,9 @@ class WhoopClient:
         self,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-        limit: int = 25,
+        limit: int = MAX_PAGE,
         next_token: Optional[str] = None,
-    ) -> tuple[List[Recovery], Optional[str]]:
+    ) -> tuple[List[Recovery | RecoveryLite], Optional[str]]:
         """
         Get recovery scores.
         GET /v2/recovery
@@ -332,17 +597,10 @@ class WhoopClient:
         Returns:
             Tuple of (list of recovery records, next_token for pagination)
         """
-        params = {"limit": limit}
-        if start_date:
-            params["start"] = f"{start_date}T00:00:00.000Z"
-        if end_date:
-            params["end"] = f"{end_date}T23:59:59.999Z"
-        if next_token:
-            params["nextToken"] = next_token
-        
-        data = await self._get("/v2/recovery", params)
-        recovery_records = [Recovery(**record) for record in data.get("records", [])]
-        return recovery_records, data.get("next_token")
+        adapter = _RECOVERY_PAGE if self.validate_scores else _RECOVERY_LITE_PAGE
+        return await self._fetch_page(
+            "/v2/recovery", adapter, start_date, end_date, limit, next_token
+        )
     
     # -------------------------------------------------------------------------
     # Workout Endpoints
@@ -352,9 +610,9 @@ class WhoopClient:
         self,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-        limit: int = 25,
+        limit: int = MAX_PAGE,
         next_token: Optional[str] = None,
-    ) -> tuple[List[Workout], Optional[str]]:
+    ) -> tuple[List[Workout | WorkoutLite], Optional[str]]:
         """
         Get workout activities.
         GET /v2/activity/workout
@@ -362,17 +620,10 @@ class WhoopClient:
         Returns:
             Tuple of (list of workouts, next_token for pagination)
         """
-        params = {"limit": limit}
-        if start_date:
-            params["start"] = f"{start_date}T00:00:00.000Z"
-        if end_date:
-            params["end"] = f"{end_date}T23:59:59.999Z"
-        if next_token:
-            params["nextToken"] = next_token
-        
-        data = await self._get("/v2/activity/workout", params)
-        workouts = [Workout(**record) for record in data.get("records", [])]
-        return workouts, data.get("next_token")
+        adapter = _WORKOUT_PAGE if self.validate_scores else _WORKOUT_LITE_PAGE
+        return await self._fetch_page(
+            "/v2/activity/workout", adapter, start_date, end_date, limit, next_token
+        )
     
     # -------------------------------------------------------------------------
     # Convenience Methods
@@ -382,82 +633,108 @@ class WhoopClient:
         self,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-    ) -> List[Cycle]:
+    ) -> List[Cycle | CycleLite]:
         """Fetch all cycles with automatic pagination."""
-        all_cycles = []
-        next_token = None
-        
-        while True:
-            cycles, next_token = await self.get_cycles(
-                start_date=start_date,
-                end_date=end_date,
-                next_token=next_token,
-            )
-            all_cycles.extend(cycles)
-            if not next_token:
-                break
-        
-        return all_cycles
+        return await self._get_all(self.get_cycles, start_date, end_date, attrgetter("id"))
     
     async def get_all_sleep(
         self,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-    ) -> List[Sleep]:
+    ) -> List[Sleep | SleepLite]:
         """Fetch all sleep records with automatic pagination."""
-        all_sleep = []
-        next_token = None
-        
-        while True:
-            sleep_records, next_token = await self.get_sleep(
-                start_date=start_date,
-                end_date=end_date,
-                next_token=next_token,
-            )
-            all_sleep.extend(sleep_records)
-            if not next_token:
-                break
-        
-        return all_sleep
+        return await self._get_all(self.get_sleep, start_date, end_date, attrgetter("id"))
     
     async def get_all_recovery(
         self,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-    ) -> List[Recovery]:
+    ) -> List[Recovery | RecoveryLite]:
         """Fetch all recovery records with automatic pagination."""
-        all_recovery = []
-        next_token = None
-        
-        while True:
-            recovery_records, next_token = await self.get_recovery(
-                start_date=start_date,
-                end_date=end_date,
-                next_token=next_token,
-            )
-            all_recovery.extend(recovery_records)
-            if not next_token:
-                break
-        
-        return all_recovery
+        return await self._get_all(
+            self.get_recovery, start_date, end_date, attrgetter("cycle_id")
+        )
     
     async def get_all_workouts(
         self,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-    ) -> List[Workout]:
+    ) -> List[Workout | WorkoutLite]:
         """Fetch all workouts with automatic pagination."""
-        all_workouts = []
+        return await self._get_all(self.get_workouts, start_date, end_date, attrgetter("id"))
+    
+    async def get_all(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> SyncResult:
+        """
+        Fetch cycles, sleep, recovery and workouts for a date range at once.
+        The four collections are fetched concurrently, multiplexed over the
+        client's HTTP/2 connection.
+        """
+        cycles, sleep, recovery, workouts = await asyncio.gather(
+            self.get_all_cycles(start_date, end_date),
+            self.get_all_sleep(start_date, end_date),
+            self.get_all_recovery(start_date, end_date),
+            self.get_all_workouts(start_date, end_date),
+        )
+        # Records are already validated models
+        return SyncResult.model_construct(
+            cycles=cycles, sleep=sleep, recovery=recovery, workouts=workouts
+        )
+    
+    async def _get_all(
+        self,
+        fetch_page: Callable[..., Awaitable[tuple[list, Optional[str]]]],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        key: Callable[[Any], Hashable],
+    ) -> list:
+        """
+        Fetch every record for a date range. Bounded ranges are split into
+        shards that paginate concurrently; open-ended ranges follow next_token
+        serially. ``key`` identifies a record, so records spanning a shard
+        boundary are only returned once.
+        """
+        if start_date is None or end_date is None:
+            return await self._paginate(fetch_page, start_date, end_date)
+        
+        shards = await asyncio.gather(*(
+            self._paginate(fetch_page, shard_start, shard_end)
+            for shard_start, shard_end in _split_ranges(start_date, end_date, _SHARD_DAYS)
+        ))
+        
+        seen = set()
+        records = []
+        for shard in shards:
+            for record in shard:
+                record_key = key(record)
+                if record_key not in seen:
+                    seen.add(record_key)
+                    records.append(record)
+        return records
+    
+    async def _paginate(
+        self,
+        fetch_page: Callable[..., Awaitable[tuple[list, Optional[str]]]],
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> list:
+        """Follow next_token through every page of one date range."""
+        records = []
         next_token = None
         
         while True:
-            workouts, next_token = await self.get_workouts(
-                start_date=start_date,
-                end_date=end_date,
-                next_token=next_token,
-            )
-            all_workouts.extend(workouts)
+            async with self._page_semaphore:
+                page, next_token = await fetch_page(
+                    start_date=start_date,
+                    end_date=end_date,
+                    limit=self.MAX_PAGE,
+                    next_token=next_token,
+                )
+            records.extend(page)
             if not next_token:
                 break
         
-        return all_workouts
+        return records
@@ -130,8 +130,11 @@ async function handleSubmit(e) {
     setLoading(true);
     const loadingEl = addLoadingIndicator();
     
+    let bubbleEl = null;
+    let reply = '';
+    
     try {
-        const response = await fetch(API_BASE + '/', {
+        const response = await fetch(API_BASE + '/stream', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
@@ -149,14 +152,28 @@ async function handleSubmit(e) {
             throw new Error(errorData.detail || 'Failed to get response');
         }
         
-        const data = await response.json();
+        // Render the reply as Server-Sent Events arrive
+        await readEventStream(response, (event, data) => {
+            if (event === 'error') {
+                throw new Error(data.detail || 'Failed to get response');
+            }
+            if (data.chunk) {
+                if (!bubbleEl) {
+                    // Swap the loading indicator for the reply on the first chunk
+                    loadingEl.remove();
+                    bubbleEl = addMessage('assistant', '');
+                }
+                reply += data.chunk;
+                bubbleEl.textContent = reply;
+                scrollToBottom();
+            }
+        });
         
-        // Remove loading indicator
         loadingEl.remove();
-        
-        // Add assistant message to UI
-        addMessage('assistant', data.response);
-        conversationHistory.push({ role: 'assistant', content: data.response });
+        if (!bubbleEl) {
+            addMessage('assistant', reply);
+        }
+        conversationHistory.push({ role: 'assistant', content: reply });
         
     } catch (error) {
         console.error('Error:', error);
@@ -167,6 +184,37 @@ async function handleSubmit(e) {
     }
 }
 
+// Read a Server-Sent Events response body, calling onEvent(event, data) per message
+async function readEventStream(response, onEvent) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        
+        // Messages are separated by a blank line
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const raw = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+            
+            let event = 'message';
+            let data = '';
+            for (const line of raw.split('\n')) {
+                if (line.startsWith('event: ')) {
+                    event = line.slice(7);
+                } else if (line.startsWith('data: ')) {
+                    data += line.slice(6);
+                }
+            }
+            onEvent(event, data ? JSON.parse(data) : {});
+        }
+    }
+}
+
 // Add a message to the chat
 function addMessage(role, content) {
     const messageEl = document.createElement('div');
@@ -185,6 +233,8 @@ function addMessage(role, content) {
     
     chatContainer.appendChild(messageEl);
     scrollToBottom();
+    
+    return bubbleEl;
 }
 
 // Add loading indicator